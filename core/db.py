@@ -11,71 +11,152 @@ Responsibilities:
 - Create `focuswell.db` if it doesn't exist
 - Ensure required columns exist (due_date, due_time)
 - Provide helper functions for CRUD operations
+- Keep one long-lived connection for the whole process
 """
 
-import os
 import sqlite3
-from typing import Iterable
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 # ------------------------------------------------------------
 # Database path (one level above /core)
 # ------------------------------------------------------------
-_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "focuswell.db")
-_DB_PATH = os.path.normpath(_DB_PATH)
+_DB_PATH = str(Path(__file__).resolve().parent.parent / "focuswell.db")
+
+# ------------------------------------------------------------
+# Connection tuning (applied once per connection)
+# ------------------------------------------------------------
+# Prepared statements kept per connection (keyed by exact SQL text)
+_STATEMENT_CACHE_SIZE = 512
+
+_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",     # safe with WAL, no fsync per commit
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",      # ~64 MB page cache
+    "PRAGMA busy_timeout = 5000",      # ms
+    "PRAGMA mmap_size = 134217728",    # 128 MB
+)
 
 # ------------------------------------------------------------
 # Connection helper
 # ------------------------------------------------------------
 def get_connection() -> sqlite3.Connection:
     """
-    Returns a live SQLite connection with foreign keys enabled.
+    Returns a new SQLite connection (autocommit) with foreign keys enabled,
+    WAL journaling and the tuning PRAGMAs above.
+    Used once to open the shared connection; see `_get_conn()`.
     """
-    conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(
+        _DB_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
     conn.execute("PRAGMA foreign_keys = ON")
+    # WAL is persistent in the file header: only switch when not already on
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if str(mode).lower() != "wal":
+        conn.execute("PRAGMA journal_mode = WAL")
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 # ------------------------------------------------------------
-# Ensure optional columns (due_date / due_time)
+# Shared connection (opened lazily, reused by every helper)
+# ------------------------------------------------------------
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it on first use."""
+    global _conn
+    with _lock:
+        if _conn is None:
+            _conn = get_connection()
+        return _conn
+
+def close_db() -> None:
+    """Close the shared connection (call on shutdown)."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            try:
+                _conn.close()
+            finally:
+                _conn = None
+
+# ------------------------------------------------------------
+# Schema version (stored in PRAGMA user_version)
 # ------------------------------------------------------------
-def _ensure_due_date_column(conn: sqlite3.Connection) -> None:
-    """Add 'due_date' column if missing (TEXT ISO 'YYYY-MM-DD')."""
-    cur = conn.execute("PRAGMA table_info(tasks)")
-    cols = [row[1] for row in cur.fetchall()]
-    if "due_date" not in cols:
-        conn.execute("ALTER TABLE tasks ADD COLUMN due_date TEXT")
-        conn.commit()
+_SCHEMA_VERSION = 3
+
+_CREATE_TASKS = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        done INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP NOT NULL DEFAULT (datetime('now')),
+        updated_at TIMESTAMP
+    );
+"""
 
-def _ensure_due_time_column(conn: sqlite3.Connection) -> None:
-    """Add 'due_time' column if missing (TEXT 'HH:MM')."""
-    cur = conn.execute("PRAGMA table_info(tasks)")
-    cols = [row[1] for row in cur.fetchall()]
-    if "due_time" not in cols:
-        conn.execute("ALTER TABLE tasks ADD COLUMN due_time TEXT")
-        conn.commit()
+# Optional columns added by migration: name → ALTER statement
+_OPTIONAL_COLUMNS = (
+    ("due_date", "ALTER TABLE tasks ADD COLUMN due_date TEXT;"),  # ISO 'YYYY-MM-DD'
+    ("due_time", "ALTER TABLE tasks ADD COLUMN due_time TEXT;"),  # 'HH:MM'
+)
+
+# v2: "no date / no time" is a real NULL, never an empty string
+_NORMALIZE_EMPTY = (
+    "UPDATE tasks SET due_date = NULL WHERE TRIM(due_date) = '';",
+    "UPDATE tasks SET due_time = NULL WHERE TRIM(due_time) = '';",
+    "UPDATE tasks SET updated_at = NULL WHERE TRIM(updated_at) = '';",
+)
+
+# v3: indexes matching the planner's ORDER BY (NULLs last via `col IS NULL`),
+# so date lookups and upcoming/open lists are read in order, no sort step
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tasks_due "
+    "ON tasks (due_date, due_time IS NULL, due_time, id DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_due_open "
+    "ON tasks (due_date IS NULL, due_date, due_time IS NULL, due_time, id DESC) WHERE done = 0;",
+)
+
+# ------------------------------------------------------------
+# Ensure optional columns (due_date / due_time)
+# ------------------------------------------------------------
+def _schema_statements(conn: sqlite3.Connection) -> list[str]:
+    """
+    Statements that create the table, add only the optional columns that
+    are missing (single PRAGMA table_info scan), turn legacy empty strings
+    into NULL, create the indexes, and stamp the schema version.
+    """
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(tasks)").fetchall()}
+    parts = [_CREATE_TASKS]
+    parts += [alter for name, alter in _OPTIONAL_COLUMNS if name not in cols]
+    parts += _NORMALIZE_EMPTY
+    parts += _INDEXES
+    parts.append(f"PRAGMA user_version = {_SCHEMA_VERSION};")
+    return parts
 
 # ------------------------------------------------------------
 # Database initialization
 # ------------------------------------------------------------
 def init_db() -> None:
-    """Creates the tasks table if it doesn't exist and ensures columns."""
-    conn = get_connection()
-    try:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                done INTEGER NOT NULL DEFAULT 0,
-                created_at TIMESTAMP NOT NULL DEFAULT (datetime('now')),
-                updated_at TIMESTAMP
-            )
-            """
-        )
-        conn.commit()
-        _ensure_due_date_column(conn)
-        _ensure_due_time_column(conn)
-    finally:
-        conn.close()
+    """
+    Creates the tasks table if it doesn't exist and ensures columns.
+    Skipped entirely once the file is already at `_SCHEMA_VERSION`;
+    otherwise the whole migration runs in one `transaction()`.
+    """
+    with _lock:
+        conn = _get_conn()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        with transaction() as c:
+            for stmt in _schema_statements(conn):
+                c.execute(stmt)
 
 # ------------------------------------------------------------
 # CRUD helpers
@@ -83,23 +164,65 @@ def init_db() -> None:
 def execute(sql: str, params: Iterable = ()) -> int:
     """
     Execute INSERT / UPDATE / DELETE and return lastrowid (or 0).
+    The connection is in autocommit mode, so no explicit commit is needed;
+    inside `transaction()` the statement joins the open transaction.
     """
-    conn = get_connection()
-    try:
-        cur = conn.execute(sql, tuple(params))
-        conn.commit()
+    with _lock:
+        cur = _get_conn().execute(sql, tuple(params))
         return cur.lastrowid or 0
-    finally:
-        conn.close()
 
 def query_all(sql: str, params: Iterable = ()) -> list[tuple]:
     """
     Execute SELECT and return all rows as a list of tuples.
     """
-    conn = get_connection()
-    try:
-        cur = conn.execute(sql, tuple(params))
-        rows = cur.fetchall()
-        return rows
-    finally:
-        conn.close()
+    with _lock:
+        cur = _get_conn().execute(sql, tuple(params))
+        return cur.fetchall()
+
+# ------------------------------------------------------------
+# Batch helpers (one transaction for many statements)
+# ------------------------------------------------------------
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Group several statements into a single BEGIN…COMMIT.
+
+    Usage:
+        with db.transaction() as c:
+            c.execute(...)
+            c.execute(...)
+
+    Rolls back if the block raises. Inside an already open transaction
+    it becomes a SAVEPOINT, so only the inner block is undone.
+    """
+    with _lock:
+        conn = _get_conn()
+        if conn.in_transaction:
+            conn.execute("SAVEPOINT nested")
+            try:
+                yield conn
+            except BaseException:
+                # SQLite may already have rolled the whole transaction back
+                # (SQLITE_FULL, I/O or busy errors); keep the original error
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK TO nested")
+                    conn.execute("RELEASE nested")
+                raise
+            conn.execute("RELEASE nested")
+            return
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+def execute_many(sql: str, seq_of_params: Iterable[Iterable]) -> None:
+    """
+    Execute the same INSERT / UPDATE / DELETE for every params tuple
+    inside one transaction.
+    """
+    with transaction() as conn:
+        conn.executemany(sql, (tuple(p) for p in seq_of_params))
@@ -4,15 +4,16 @@ core/loop.py
 Central scheduler: 1 tick per second without blocking the Tkinter UI.
 
 This loop:
-  • starts/stops a periodic tick via `root.after`,
+  • starts/stops a periodic tick via `root.after` (only while listeners exist),
   • notifies registered listeners with the app uptime (in seconds),
-  • optionally triggers wellness nudges (eye care / hydration / stretch) based on core.config.
+  • optionally triggers wellness nudges (eye care / hydration / stretch) based on core.config,
+    each on its own `root.after` timer instead of being polled every second.
 """
 
+import time
 import tkinter as tk
-from typing import Callable, List
+from typing import Callable, List, Optional, Tuple
 
-from ui.toasts import show_toast
 from core.config import (
     ENABLE_EYE_CARE,
     ENABLE_HYDRATION_NUDGE,
@@ -36,35 +37,60 @@ class AppLoop:
     Notes:
         • No threads are used; scheduling relies on `root.after`, keeping the UI responsive.
         • Each registered listener is called with the total uptime (seconds).
+        • The 1 Hz tick only runs while at least one listener is registered;
+          wellness nudges are scheduled on their own `root.after` timers.
     """
 
     def __init__(self, root: tk.Tk, interval_ms: int = 1000) -> None:
         self.root = root
         self.interval_ms = interval_ms
         self._running = False
-        self._seconds_since_start = 0
+
+        # Uptime bookkeeping (monotonic clock; paused while stopped)
+        self._elapsed_before = 0.0
+        self._started_at = 0.0
 
         print(
             f"[AppLoop] EYE={ENABLE_EYE_CARE} | HYDRATION={ENABLE_HYDRATION_NUDGE} | STRETCH={ENABLE_STRETCH_NUDGE}"
         )
 
-        # Per-nudge counters
-        self._sec_eye = 0
-        self._sec_hydration = 0
-        self._sec_stretch = 0
+        # Enabled nudges only: (interval_sec, message); disabled ones are never scheduled
+        self._nudges: List[Tuple[int, str]] = [
+            (interval, message)
+            for enabled, interval, message in (
+                (ENABLE_EYE_CARE, EYE_BREAK_INTERVAL_SEC, EYE_BREAK_MESSAGE),
+                (ENABLE_HYDRATION_NUDGE, HYDRATION_NUDGE_INTERVAL_SEC, HYDRATION_NUDGE_MESSAGE),
+                (ENABLE_STRETCH_NUDGE, STRETCH_NUDGE_INTERVAL_SEC, STRETCH_NUDGE_MESSAGE),
+            )
+            if enabled
+        ]
+        # Next uptime (seconds) at which each nudge fires
+        self._next_fire: List[int] = [interval for interval, _ in self._nudges]
+
+        # Pending `root.after` ids (None = not scheduled)
+        self._tick_job: Optional[str] = None
+        self._nudge_jobs: List[Optional[str]] = [None] * len(self._nudges)
 
         self._tick_listeners: List[Callable[[int], None]] = []
+        # Immutable copy iterated by `_tick`; rebuilt only on add/remove
+        self._tick_listeners_snapshot: Tuple[Callable[[int], None], ...] = ()
 
     # ---------------- Listener registration ----------------
     def add_tick_listener(self, cb: Callable[[int], None]) -> None:
         """Register a listener to be called every tick with uptime seconds."""
         if cb not in self._tick_listeners:
             self._tick_listeners.append(cb)
+            self._tick_listeners_snapshot = tuple(self._tick_listeners)
+            if self._running and self._tick_job is None:
+                self._schedule_tick()
 
     def remove_tick_listener(self, cb: Callable[[int], None]) -> None:
         """Remove a previously registered listener."""
         if cb in self._tick_listeners:
             self._tick_listeners.remove(cb)
+            self._tick_listeners_snapshot = tuple(self._tick_listeners)
+            if not self._tick_listeners:
+                self._cancel_tick()
 
     # ---------------- Loop control ----------------
     def start(self) -> None:
@@ -72,54 +98,80 @@ class AppLoop:
         if self._running:
             return
         self._running = True
-        self._tick()
+        self._started_at = time.monotonic()
+        for i in range(len(self._nudges)):
+            self._schedule_nudge(i)
+        if self._tick_listeners:
+            self._schedule_tick()
 
     def stop(self) -> None:
-        """Pause the loop (counters are preserved)."""
+        """Pause the loop (uptime and nudge deadlines are preserved)."""
+        if not self._running:
+            return
+        self._elapsed_before += time.monotonic() - self._started_at
         self._running = False
+        self._cancel_tick()
+        for i, job in enumerate(self._nudge_jobs):
+            if job is not None:
+                self.root.after_cancel(job)
+                self._nudge_jobs[i] = None
 
     def is_running(self) -> bool:
         """Return True if the loop is currently running."""
         return self._running
 
     def uptime(self) -> int:
-        """Total seconds since the loop started."""
-        return self._seconds_since_start
+        """Total seconds the loop has been running."""
+        return int(self._uptime_f())
 
     # ---------------- Internal scheduling ----------------
-    def _tick(self) -> None:
-        """Execute one tick and schedule the next via `root.after`."""
+    def _uptime_f(self) -> float:
+        if not self._running:
+            return self._elapsed_before
+        return self._elapsed_before + (time.monotonic() - self._started_at)
+
+    def _schedule_tick(self) -> None:
+        self._tick_job = self.root.after(self.interval_ms, self._tick)
+
+    def _cancel_tick(self) -> None:
+        if self._tick_job is not None:
+            self.root.after_cancel(self._tick_job)
+            self._tick_job = None
+
+    def _schedule_nudge(self, i: int) -> None:
+        delay_sec = max(self._next_fire[i] - self._uptime_f(), 0.0)
+        self._nudge_jobs[i] = self.root.after(int(delay_sec * 1000), lambda: self._fire_nudge(i))
+
+    def _fire_nudge(self, i: int) -> None:
+        """Show one wellness nudge and schedule its next occurrence."""
+        self._nudge_jobs[i] = None
         if not self._running:
             return
+        # Imported lazily: with every nudge disabled (the default) ui.toasts is never loaded
+        from ui.toasts import show_toast
 
-        self._seconds_since_start += 1
-
-        # Optional wellness nudges (config-driven)
-        if ENABLE_EYE_CARE:
-            self._sec_eye += 1
-            if self._sec_eye >= EYE_BREAK_INTERVAL_SEC:
-                show_toast(self.root, EYE_BREAK_MESSAGE, 3000)
-                self._sec_eye = 0
-
-        if ENABLE_HYDRATION_NUDGE:
-            self._sec_hydration += 1
-            if self._sec_hydration >= HYDRATION_NUDGE_INTERVAL_SEC:
-                show_toast(self.root, HYDRATION_NUDGE_MESSAGE, 3000)
-                self._sec_hydration = 0
-
-        if ENABLE_STRETCH_NUDGE:
-            self._sec_stretch += 1
-            if self._sec_stretch >= STRETCH_NUDGE_INTERVAL_SEC:
-                show_toast(self.root, STRETCH_NUDGE_MESSAGE, 3000)
-                self._sec_stretch = 0
-
-        # Notify listeners (e.g., focus timer, hydration UI, etc.)
-        for cb in list(self._tick_listeners):
+        interval, message = self._nudges[i]
+        show_toast(self.root, message, 3000)
+        self._next_fire[i] += interval
+        self._schedule_nudge(i)
+
+    def _tick(self) -> None:
+        """Schedule the next tick first, then queue listeners for the idle phase."""
+        self._tick_job = None
+        if not self._running or not self._tick_listeners:
+            return
+
+        # Next tick is always `interval_ms` away, however long listeners take
+        self._schedule_tick()
+        self.root.after_idle(self._run_listeners, self.uptime())
+
+    def _run_listeners(self, uptime: int) -> None:
+        """Notify listeners (e.g., focus timer, hydration UI, etc.) in one batch."""
+        if not self._running:
+            return
+        for cb in self._tick_listeners_snapshot:
             try:
-                cb(self._seconds_since_start)
+                cb(uptime)
             except Exception:
                 # Guard against third-party listener exceptions
                 pass
-
-        # Schedule next tick
-        self.root.after(self.interval_ms, self._tick)
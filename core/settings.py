@@ -11,21 +11,41 @@ to `settings.json` located one level above the /core folder.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import json
 import os
+import re
+from pathlib import Path
 from typing import Optional
 
+# optional: orjson (C encoder/decoder); stdlib json otherwise
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # ------------------------------------------------------------
 # Path to settings file (one level above /core)
 # ------------------------------------------------------------
-_SETTINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "settings.json")
-_SETTINGS_PATH = os.path.normpath(_SETTINGS_PATH)
+_SETTINGS_FILE = Path(__file__).resolve().parent.parent / "settings.json"
+_SETTINGS_PATH = str(_SETTINGS_FILE)
+_SETTINGS_TMP_PATH = _SETTINGS_PATH + ".tmp"
+_SETTINGS_DIR = _SETTINGS_FILE.parent
+
+# Parsed settings keyed by the file's mtime (ns); None = nothing cached yet
+_cache: Optional[tuple[int, AppSettings]] = None
+
+# Allowed values for the enumerated fields
+_SEX = frozenset(("male", "female"))
+_ACTIVITY = frozenset(("low", "moderate", "high"))
 
 # ------------------------------------------------------------
 # Dataclass: AppSettings
 # ------------------------------------------------------------
-@dataclass
+# Frozen: load_settings() hands the cached instance to every caller, so
+# edits go through dataclasses.replace() / a new AppSettings instead
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     sex: str = "female"                 # "male" | "female"
     weight_kg: Optional[float] = None   # e.g. 68.0
@@ -36,20 +56,59 @@ class AppSettings:
     def is_complete(self) -> bool:
         """
         Return True if all required fields are properly filled.
+        Numeric fields are type-checked once in `load_settings()`.
         """
         return (
-            self.sex in ("male", "female")
-            and isinstance(self.weight_kg, (int, float)) and (self.weight_kg or 0) > 0
-            and isinstance(self.temperature_c, (int, float))
-            and self.activity in ("low", "moderate", "high")
+            self.sex in _SEX
+            and self.activity in _ACTIVITY
+            and self.temperature_c is not None
+            and self.weight_kg is not None
+            and self.weight_kg > 0
         )
 
 # ------------------------------------------------------------
-# Internal helper
+# Internal helpers
 # ------------------------------------------------------------
-def _ensure_dir(path: str) -> None:
-    """Ensure that the parent directory exists."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def _ensure_dir() -> None:
+    """Ensure that the settings directory exists."""
+    _SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+
+def _to_dict(s: AppSettings) -> dict:
+    """Plain dict of the known fields (cheaper than dataclasses.asdict)."""
+    return {
+        "sex": s.sex,
+        "weight_kg": s.weight_kg,
+        "temperature_c": s.temperature_c,
+        "activity": s.activity,
+        "timezone": s.timezone,
+    }
+
+def _dumps(data: dict) -> bytes:
+    """Encode settings as pretty-printed UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _as_number(v: object) -> Optional[float]:
+    """Keep JSON numbers, drop anything else (e.g. a quoted "70")."""
+    return v if isinstance(v, (int, float)) else None
+
+def _loads(raw: bytes) -> dict:
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+# ------------------------------------------------------------
+# Form input helper (shared by the wizard and the Settings window)
+# ------------------------------------------------------------
+# "70", "-3", "72.5", "72,5", "72.", ".5" — checked before float() so the
+# common invalid-while-typing case never raises
+_NUM_RE = re.compile(r"[+-]?(?:\d+(?:[.,]\d*)?|[.,]\d+)")
+
+def parse_float(s: Optional[str]) -> Optional[float]:
+    """Parse a user-typed decimal (comma or dot); None if it isn't one."""
+    s2 = (s or "").strip()
+    if not _NUM_RE.fullmatch(s2):
+        return None
+    return float(s2.replace(",", "."))
 
 # ------------------------------------------------------------
 # Public API: load / save
@@ -58,18 +117,47 @@ def load_settings() -> AppSettings:
     """
     Load user settings from JSON file.
     Returns default settings if the file is missing or invalid.
+    The parsed result is cached until the file's mtime changes.
     """
+    global _cache
     try:
-        with open(_SETTINGS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return AppSettings(**data)
+        mtime = os.stat(_SETTINGS_PATH).st_mtime_ns
+    except OSError:
+        return AppSettings()
+    if _cache is not None and _cache[0] == mtime:
+        return _cache[1]
+    try:
+        with open(_SETTINGS_PATH, "rb") as f:
+            data = _loads(f.read())
+        data["weight_kg"] = _as_number(data.get("weight_kg"))
+        data["temperature_c"] = _as_number(data.get("temperature_c"))
+        settings = AppSettings(**data)
     except Exception:
         return AppSettings()
+    _cache = (mtime, settings)
+    return settings
 
-def save_settings(s: AppSettings) -> None:
+def save_settings(s: AppSettings, durable: bool = True) -> None:
     """
     Save current settings to JSON (UTF-8, pretty formatted).
+
+    Writes to a temp file and swaps it in with `os.replace`, so a crash
+    never leaves a truncated settings.json. `durable=False` skips fsync.
     """
-    _ensure_dir(_SETTINGS_PATH)
-    with open(_SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(asdict(s), f, ensure_ascii=False, indent=2)
+    global _cache
+    _ensure_dir()
+    try:
+        with open(_SETTINGS_TMP_PATH, "wb") as f:
+            f.write(_dumps(_to_dict(s)))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(_SETTINGS_TMP_PATH, _SETTINGS_PATH)
+    except BaseException:
+        # never leave a half-written settings.json.tmp behind
+        try:
+            os.unlink(_SETTINGS_TMP_PATH)
+        except OSError:
+            pass
+        raise
+    _cache = (os.stat(_SETTINGS_PATH).st_mtime_ns, s)
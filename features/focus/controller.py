@@ -8,7 +8,8 @@ Provides callbacks to the UI (view) for updates and phase changes.
 """
 
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from enum import IntEnum
+from typing import Callable, Tuple
 
 # ---- Demo durations (for quick testing)
 DEMO_WORK_SEC = 10
@@ -18,13 +19,24 @@ DEMO_BREAK_SEC = 5
 DEFAULT_WORK_SEC = 25 * 60
 DEFAULT_BREAK_SEC = 5 * 60
 
-Phase = str  # "IDLE" | "WORK" | "BREAK"
+class Phase(IntEnum):
+    """Timer phase; small ints for cheap comparisons, `str()` gives the name."""
+    IDLE = 0
+    WORK = 1
+    BREAK = 2
 
+    def __str__(self) -> str:
+        return self.name
 
-@dataclass
+
+def _noop(*_args) -> None:
+    """Default callback until the view registers one."""
+
+
+@dataclass(frozen=True, slots=True)
 class FocusState:
-    """Represents the current state of the focus timer."""
-    phase: Phase = "IDLE"
+    """Read-only snapshot of the focus timer state (see `FocusController.snapshot`)."""
+    phase: Phase = Phase.IDLE
     running: bool = False
     remaining_sec: int = 0
     routine: Tuple[int, int] = (DEMO_WORK_SEC, DEMO_BREAK_SEC)  # (work, break)
@@ -33,12 +45,19 @@ class FocusState:
 class FocusController:
     """
     Handles timer logic: starting, pausing, resetting, and switching phases.
+
+    State lives in plain attributes (no wrapper object) since `on_tick`
+    touches it every second; use `snapshot()` for a FocusState view.
     """
 
     def __init__(self) -> None:
-        self._state = FocusState()
-        self._on_update: Optional[Callable[[], None]] = None
-        self._on_phase_change: Optional[Callable[[Phase], None]] = None
+        self._phase: Phase = Phase.IDLE
+        self._running = False
+        self._remaining = 0
+        self._work_sec = DEMO_WORK_SEC
+        self._break_sec = DEMO_BREAK_SEC
+        self._on_update: Callable[[], None] = _noop
+        self._on_phase_change: Callable[[Phase], None] = _noop
 
     # ----- Callbacks to View -----
     def set_on_update(self, cb: Callable[[], None]) -> None:
@@ -52,81 +71,78 @@ class FocusController:
     # ----- Public API -----
     def set_routine(self, work_sec: int, break_sec: int) -> None:
         """Define durations for work and break sessions."""
-        self._state.routine = (work_sec, break_sec)
-        if self._state.phase in ("IDLE", "WORK"):
-            self._state.remaining_sec = work_sec
-            self._state.phase = "WORK"
+        self._work_sec, self._break_sec = work_sec, break_sec
+        if self._phase != Phase.BREAK:
+            self._remaining = work_sec
+            self._phase = Phase.WORK
         else:
-            self._state.remaining_sec = break_sec
+            self._remaining = break_sec
         self._emit_update()
 
     def start(self) -> None:
         """Start or resume the timer."""
-        if self._state.phase == "IDLE":
-            self._state.phase = "WORK"
-            self._state.remaining_sec = self._state.routine[0]
+        if self._phase == Phase.IDLE:
+            self._phase = Phase.WORK
+            self._remaining = self._work_sec
             self._emit_phase_change()
-        self._state.running = True
+        self._running = True
         self._emit_update()
 
     def pause(self) -> None:
         """Pause the timer."""
-        self._state.running = False
+        self._running = False
         self._emit_update()
 
     def reset(self) -> None:
         """Reset to IDLE state."""
-        self._state.running = False
-        self._state.phase = "IDLE"
-        self._state.remaining_sec = 0
+        self._running = False
+        self._phase = Phase.IDLE
+        self._remaining = 0
         self._emit_update()
 
     def on_tick(self, _total_seconds: int) -> None:
         """Called every second by AppLoop to decrease remaining time."""
-        if not self._state.running:
-            return
-        if self._state.remaining_sec > 0:
-            self._state.remaining_sec -= 1
-            self._emit_update()
-            if self._state.remaining_sec == 0:
+        if self._running and self._remaining > 0:
+            self._remaining -= 1
+            if self._remaining == 0:
+                # One update for the new phase instead of "00:00" + new phase
                 self._switch_phase()
+            else:
+                self._emit_update()
 
     # ----- Getters -----
     def get_phase(self) -> Phase:
-        return self._state.phase
+        return self._phase
 
     def is_running(self) -> bool:
-        return self._state.running
+        return self._running
 
     def get_remaining_sec(self) -> int:
-        return self._state.remaining_sec
+        return self._remaining
 
     def get_routine(self) -> Tuple[int, int]:
-        return self._state.routine
+        return (self._work_sec, self._break_sec)
+
+    def snapshot(self) -> FocusState:
+        """Return the current state as an immutable FocusState."""
+        return FocusState(self._phase, self._running, self._remaining, (self._work_sec, self._break_sec))
 
     # ----- Internal -----
     def _switch_phase(self) -> None:
         """Switch between work and break phases."""
-        work_sec, break_sec = self._state.routine
-        if self._state.phase == "WORK":
-            self._state.phase = "BREAK"
-            self._state.remaining_sec = break_sec
+        if self._phase == Phase.WORK:
+            self._phase = Phase.BREAK
+            self._remaining = self._break_sec
         else:
-            self._state.phase = "WORK"
-            self._state.remaining_sec = work_sec
+            self._phase = Phase.WORK
+            self._remaining = self._work_sec
         self._emit_phase_change()
         self._emit_update()
 
+    # Callbacks are always bound (real cb or _noop); errors propagate to the
+    # caller (Tk reports them via report_callback_exception).
     def _emit_update(self) -> None:
-        if self._on_update:
-            try:
-                self._on_update()
-            except Exception:
-                pass
+        self._on_update()
 
     def _emit_phase_change(self) -> None:
-        if self._on_phase_change:
-            try:
-                self._on_phase_change(self._state.phase)
-            except Exception:
-                pass
+        self._on_phase_change(self._phase)
@@ -13,13 +13,17 @@ Home screen: Focus Timer + Hydration + Calendar/Tasks
 from __future__ import annotations
 import re
 import tkinter as tk
+import tkinter.font as tkfont
+from functools import lru_cache
 from tkinter import ttk, colorchooser
 from typing import Callable, Optional, Dict
 from datetime import datetime, timedelta, timezone
 
+from ui.debounce import debounced
 from ui.toasts import show_toast
 from features.focus.controller import (
     FocusController,
+    Phase,
     DEMO_WORK_SEC, DEMO_BREAK_SEC,
     DEFAULT_WORK_SEC, DEFAULT_BREAK_SEC,
 )
@@ -49,15 +53,18 @@ except Exception:
 
 
 # ---------- time helpers ----------
+@lru_cache(maxsize=4096)
 def _fmt_mmss(sec: int) -> str:
     m, s = sec // 60, sec % 60
     return f"{m:02d}:{s:02d}"
 
 _OFFSET_PAT = re.compile(r'^(?:UTC)?\s*([+-])\s*(\d{1,2})(?::?(\d{2}))?$')
 
+@lru_cache(maxsize=32)
 def _parse_utc_offset(tz_str: str) -> Optional[timezone]:
+    """Parse '+HH:MM' / 'UTC-5' style offsets; `tz_str` must already be stripped."""
     if not tz_str: return None
-    m = _OFFSET_PAT.match(tz_str.strip())
+    m = _OFFSET_PAT.match(tz_str)
     if not m: return None
     sign, hh, mm = m.groups()
     h, m_ = int(hh), int(mm) if mm else 0
@@ -66,24 +73,37 @@ def _parse_utc_offset(tz_str: str) -> Optional[timezone]:
     if sign == "-": delta = -delta
     return timezone(delta)
 
-def _current_tzinfo():
-    try:
-        tz_name = (load_settings().timezone or "").strip()
-    except Exception:
-        tz_name = ""
+# last resolved timezone: rebuilt only when the saved tz name changes
+_TZ_CACHE: Dict[str, object] = {"key": None, "tz": None}
+
+def _resolve_tzinfo(tz_name: str):
     if not tz_name: return None
     if ZoneInfo is not None:
         try: return ZoneInfo(tz_name)
         except Exception: pass
     return _parse_utc_offset(tz_name)
 
+def _current_tzinfo():
+    try:
+        tz_name = (load_settings().timezone or "").strip()
+    except Exception:
+        tz_name = ""
+    if tz_name != _TZ_CACHE["key"]:
+        _TZ_CACHE["key"] = tz_name
+        _TZ_CACHE["tz"] = _resolve_tzinfo(tz_name)
+    return _TZ_CACHE["tz"]
+
 def _now_parts() -> tuple[str, str]:
-    tz = _current_tzinfo()
-    now = datetime.now(tz) if tz else datetime.now()
-    return now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S")
+    # fixed formats: plain field formatting is cheaper than strftime
+    now = datetime.now(_current_tzinfo())
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}",
+        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
+    )
 
 
 # ---------- palette & styling ----------
+@lru_cache(maxsize=64)
 def _luma(hex_color: str) -> float:
     try:
         c = hex_color.lstrip("#")
@@ -108,39 +128,71 @@ def _palette(mode: str, custom_bg: str|None=None, custom_fg: str|None=None) -> D
 
     return {"bg": bg, "surface": surface, "surface2": surface2, "text": text, "muted": muted, "accent": accent, "ok": "#22C55E"}
 
-def _apply_styles(root: tk.Tk, pal: Dict[str,str]) -> None:
-    style = ttk.Style(root)
+def _style_spec(pal: Dict[str,str]) -> tuple[Dict[str,dict], Dict[str,dict]]:
+    """Desired (configure, map) options per ttk style name for a palette."""
+    configure = {
+        ".": dict(background=pal["bg"], foreground=pal["text"], font=("Segoe UI", 10)),
+        "Header.TFrame": dict(background=pal["bg"]),
+        "Card.TFrame": dict(background=pal["surface"], relief="flat", borderwidth=0),
+        "Card2.TFrame": dict(background=pal["surface2"], relief="flat", borderwidth=0),
+        "Card.TLabel": dict(background=pal["surface"], foreground=pal["text"]),
+        "Card2.TLabel": dict(background=pal["surface2"], foreground=pal["text"]),
+        "Muted.TLabel": dict(background=pal["bg"], foreground=pal["muted"]),
+        "Card.TLabelframe": dict(background=pal["surface"], foreground=pal["text"]),
+        "Card.TLabelframe.Label": dict(background=pal["surface"], foreground=pal["text"], font=("Segoe UI", 10, "bold")),
+        "Accent.TButton": dict(background=pal["accent"], foreground="#FFFFFF"),
+        "Green.Horizontal.TProgressbar": dict(troughcolor=pal["surface"], background=pal["ok"]),
+        # Dark-mode visibility fixes for input widgets
+        "TCombobox": dict(fieldbackground=pal["surface2"], background=pal["surface2"], foreground=pal["text"]),
+        "TEntry": dict(fieldbackground=pal["surface2"], foreground=pal["text"]),
+        "TSpinbox": dict(fieldbackground=pal["surface2"], foreground=pal["text"]),
+    }
+    maps = {
+        "Accent.TButton": dict(background=[("active", pal["accent"])], foreground=[("active", "#FFFFFF")]),
+        "TCombobox": dict(fieldbackground=[("readonly", pal["surface2"])], foreground=[("readonly", pal["text"])]),
+    }
+    return configure, maps
+
+# options last pushed to ttk per style name (only the delta is re-applied),
+# kept per Tcl interpreter and valid only for the theme they were applied to
+_APPLIED: Dict[object, dict] = {}
+
+def _applied_for(root: tk.Tk, style: ttk.Style) -> dict:
+    cache = _APPLIED.get(root.tk)
     try:
-        base = "clam" if "clam" in style.theme_names() else style.theme_use()
-        style.theme_use(base)
+        current = style.theme_use()
     except Exception:
-        pass
+        current = None
+    if cache is None or cache["theme"] != current:
+        # first styling of this interpreter, or the theme was reset elsewhere
+        try:
+            base = "clam" if "clam" in style.theme_names() else current
+            style.theme_use(base)
+            current = style.theme_use()
+        except Exception:
+            pass
+        cache = _APPLIED[root.tk] = {"theme": current, "styles": {}, "maps": {}}
+    return cache
+
+def _apply_styles(root: tk.Tk, pal: Dict[str,str]) -> None:
+    style = ttk.Style(root)
+    applied = _applied_for(root, style)
+    applied_styles, applied_maps = applied["styles"], applied["maps"]
 
     try: root.configure(bg=pal["bg"])
     except Exception: pass
 
-    style.configure(".", background=pal["bg"], foreground=pal["text"], font=("Segoe UI", 10))
-    style.configure("Header.TFrame", background=pal["bg"])
-
-    style.configure("Card.TFrame", background=pal["surface"], relief="flat", borderwidth=0)
-    style.configure("Card2.TFrame", background=pal["surface2"], relief="flat", borderwidth=0)
-    style.configure("Card.TLabel", background=pal["surface"], foreground=pal["text"])
-    style.configure("Card2.TLabel", background=pal["surface2"], foreground=pal["text"])
-    style.configure("Muted.TLabel", background=pal["bg"], foreground=pal["muted"])
-
-    style.configure("Card.TLabelframe", background=pal["surface"], foreground=pal["text"])
-    style.configure("Card.TLabelframe.Label", background=pal["surface"], foreground=pal["text"], font=("Segoe UI", 10, "bold"))
-
-    style.configure("Accent.TButton", background=pal["accent"], foreground="#FFFFFF")
-    style.map("Accent.TButton", background=[("active", pal["accent"])], foreground=[("active", "#FFFFFF")])
-
-    style.configure("Green.Horizontal.TProgressbar", troughcolor=pal["surface"], background=pal["ok"])
-
-    # Dark-mode visibility fixes for input widgets
-    style.configure("TCombobox", fieldbackground=pal["surface2"], background=pal["surface2"], foreground=pal["text"])
-    style.map("TCombobox", fieldbackground=[("readonly", pal["surface2"])], foreground=[("readonly", pal["text"])])
-    style.configure("TEntry", fieldbackground=pal["surface2"], foreground=pal["text"])
-    style.configure("TSpinbox", fieldbackground=pal["surface2"], foreground=pal["text"])
+    configure, maps = _style_spec(pal)
+    for name, opts in configure.items():
+        prev = applied_styles.get(name, {})
+        delta = {k: v for k, v in opts.items() if prev.get(k) != v}
+        if delta:
+            style.configure(name, **delta)
+            applied_styles[name] = opts
+    for name, opts in maps.items():
+        if applied_maps.get(name) != opts:
+            style.map(name, **opts)
+            applied_maps[name] = opts
 
 def _style_calendar(cal: 'Calendar', pal: Dict[str,str]) -> None:
     try:
@@ -165,269 +217,436 @@ def _style_calendar(cal: 'Calendar', pal: Dict[str,str]) -> None:
     except Exception:
         pass
 
+class _BarAnim:
+    """Progress-bar animation state (slotted: plain attribute cells per frame)."""
+    __slots__ = ("actual", "target", "running")
+
+    def __init__(self, target: float = 0.0) -> None:
+        self.actual = 0.0
+        self.target = target
+        self.running = False
+
 def _animate(current: float, target: float, step: float) -> float:
     if abs(target-current) <= step: return target
     return current + step if target > current else current - step
 
 
+# ---------- task rows (recycled, updated in place) ----------
+# Named font shared by all task rows (created once, after a root exists)
+_ROW_FONT_NAME = "RowMono"
+_row_font: Optional[tkfont.Font] = None
+
+def _ensure_row_font(master: tk.Misc) -> str:
+    global _row_font
+    if _row_font is None:
+        _row_font = tkfont.Font(master, name=_ROW_FONT_NAME, family="Consolas", size=10)
+    return _ROW_FONT_NAME
+
+
+class _TaskRow:
+    """Widgets for one task row; `show()` rebinds them to another task."""
+
+    def __init__(self, container: ttk.Frame, on_toggle, on_set_time, on_clear_time, on_delete) -> None:
+        self.task_id = 0
+        self._on_toggle, self._on_set_time = on_toggle, on_set_time
+        self._on_clear_time, self._on_delete = on_clear_time, on_delete
+        font = _ensure_row_font(container)
+        self.frame = ttk.Frame(container, style="Card.TFrame")
+        self.done_var = tk.BooleanVar(); self.date_var = tk.StringVar()
+        self.time_var = tk.StringVar(); self.title_var = tk.StringVar()
+        ttk.Checkbutton(self.frame, variable=self.done_var, command=self._toggle).pack(side="left", ipadx=4, padx=(0,6))
+        ttk.Label(self.frame, textvariable=self.date_var, width=12, font=font, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.frame, textvariable=self.time_var, width=6, font=font, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.frame, textvariable=self.title_var, width=40, style="Card.TLabel").pack(side="left")
+        act = ttk.Frame(self.frame, style="Card.TFrame"); act.pack(side="left", padx=6)
+        ttk.Button(act, text="Set time", command=self._set_time).pack(side="left", padx=(0,6))
+        ttk.Button(act, text="Clear time", command=self._clear_time).pack(side="left", padx=(0,6))
+        ttk.Button(act, text="Delete task", command=self._delete).pack(side="left")
+
+    # button commands: bound once per pooled row, read the current task id
+    def _toggle(self) -> None: self._on_toggle(self.task_id, self.done_var.get())
+    def _set_time(self) -> None: self._on_set_time(self.task_id)
+    def _clear_time(self) -> None: self._on_clear_time(self.task_id)
+    def _delete(self) -> None: self._on_delete(self.task_id)
+
+    def show(self, task) -> None:
+        self.task_id = task.id
+        self.done_var.set(task.done)
+        self.date_var.set(task.due_date or "—")
+        self.time_var.set(task.due_time or "—")
+        self.title_var.set(task.title)
+
+
+class _TaskList:
+    """
+    Header + pool of `_TaskRow`s inside `container`.
+    Refreshing updates existing rows and only creates/hides the difference.
+    """
+
+    def __init__(self, container: ttk.Frame, *row_actions) -> None:
+        self.container = container
+        self.row_actions = row_actions
+        self.rows: list[_TaskRow] = []
+        self.visible = 0
+        self.empty_var = tk.StringVar()
+        self.empty = ttk.Label(container, textvariable=self.empty_var, style="Card.TLabel")
+        self.hdr = ttk.Frame(container, style="Card.TFrame")
+        ttk.Label(self.hdr, text="Done", width=6, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.hdr, text="Date", width=8, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.hdr, text="Time", width=6, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.hdr, text="Title", width=40, style="Card.TLabel").pack(side="left")
+        ttk.Label(self.hdr, text="Actions", style="Card.TLabel").pack(side="left", padx=8)
+
+    def show(self, items, empty_text: str) -> None:
+        if not items:
+            self._hide_rows_from(0)
+            self.hdr.pack_forget()
+            self.empty_var.set(empty_text)
+            if not self.empty.winfo_manager(): self.empty.pack(anchor="w", pady=4)
+            return
+        self.empty.pack_forget()
+        if not self.hdr.winfo_manager(): self.hdr.pack(fill="x", pady=(0,6))
+        while len(self.rows) < len(items):
+            self.rows.append(_TaskRow(self.container, *self.row_actions))
+        for i, task in enumerate(items):
+            row = self.rows[i]
+            row.show(task)
+            if i >= self.visible: row.frame.pack(fill="x", pady=2)
+        self._hide_rows_from(len(items))
+        self.visible = len(items)
+
+    def _hide_rows_from(self, n: int) -> None:
+        for row in self.rows[n:self.visible]:
+            row.frame.pack_forget()
+        self.visible = min(self.visible, n)
+
+
 # ---------- main UI ----------
-def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]], None]) -> None:
-    pc.init_storage()
-    ctrl = FocusController()
-    locals_container: dict[str, object] = {}
-
-    # time / focus state
-    date_var = tk.StringVar(); time_var = tk.StringVar()
-    _update_now(date_var, time_var)
-    phase_var = tk.StringVar(value="IDLE")
-    remain_var = tk.StringVar(value="00:00")
-
-    # hydration progress animation
-    _prog_actual = {"v": 0.0}
-    _prog_target = {"v": int(hc.get_progress_ratio()*100)}
-
-    # theme state — DEFAULT LIGHT MODE
-    theme_var = tk.StringVar(value="Light")      # "Dark" | "Light" | "Custom"
-    _bg_custom = {"v": None}
-    _fg_custom = {"v": None}
-
-    # header
-    header = ttk.Frame(parent, style="Header.TFrame", padding=(16, 10))
-    header.pack(fill="x")
-    ttk.Label(header, text="FocusWell — Home", font=("Segoe UI", 14, "bold")).pack(side="left")
-
-    theme_box = ttk.Combobox(header, textvariable=theme_var, values=["Dark", "Light", "Custom"], width=8, state="readonly")
-    theme_box.pack(side="right", padx=(6, 0))
-
-    def _apply_theme(*_):
-        mode = theme_var.get()
+class HomeView:
+    """
+    Home screen state and callbacks.
+    Widgets/vars live on `self`; Tk callbacks are bound methods (no closures).
+    """
+
+    def __init__(self, parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]], None]) -> None:
+        pc.init_storage()
+        self.parent = parent
+        self.root = parent.winfo_toplevel()
+        self.ctrl = FocusController()
+
+        # time / focus state
+        self.date_var = tk.StringVar(); self.time_var = tk.StringVar()
+        _update_now(self.date_var, self.time_var)
+        self.phase_var = tk.StringVar(value="IDLE")
+        self.remain_var = tk.StringVar(value="00:00")
+        # last values pushed to Tk (skip redundant var.set / configure per tick)
+        self._shown_phase = None; self._shown_remaining = None; self._shown_running = None
+
+        # hydration progress animation
+        self.bar = _BarAnim(target=int(hc.get_progress_ratio()*100))
+        self._bar_job: Optional[str] = None
+        self._hyd_version = -1
+
+        # theme state — DEFAULT LIGHT MODE
+        self.theme_var = tk.StringVar(value="Light")      # "Dark" | "Light" | "Custom"
+        self._bg_custom: Optional[str] = None
+        self._fg_custom: Optional[str] = None
+        self._theme_key: Optional[tuple] = None
+        self._theme_pal: Dict[str,str] = {}
+        # debounce: a burst of selections restyles once, 50 ms after the last
+        self._schedule_theme = debounced(self.parent, 50, self._apply_theme)
+        self.cal = None
+        self._time_dlg: Optional[tuple] = None
+
+        self._build_header()
+        current_pal = self._apply_theme()
+
+        # body (cards)
+        wrapper = ttk.Frame(parent, padding=16); wrapper.pack(fill="both", expand=True)
+        top = ttk.Frame(wrapper); top.pack(fill="x", pady=(0,12))
+        self._build_timer_card(top)
+        self._build_hydration_card(top)
+
+        # Bottom: Calendar + Lists
+        bottom = ttk.Frame(wrapper); bottom.pack(fill="both", expand=True)
+        self.selected_date = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self._build_calendar(bottom, current_pal)
+        self._build_lists(bottom)
+        self.refresh_day(); self.refresh_next()
+
+        # focus wiring
+        self.ctrl.set_on_update(self._on_update); self.ctrl.set_on_phase_change(self._on_phase_change)
+        self.start_btn.configure(command=self._start)
+        self.pause_btn.configure(command=self.ctrl.pause)
+        self.reset_btn.configure(command=self.ctrl.reset)
+
+        # ✅ CRITICAL: connect controller to the global 1s loop so time actually ticks
+        add_tick_listener(self.ctrl.on_tick)
+
+        # stop the self-scheduled after() chains when the Home frame goes away
+        self._clock_job: Optional[str] = None
+        self.parent.bind("<Destroy>", self._on_destroy, add="+")
+        self._clock_tick()
+        self._on_update()
+
+    # ---------- layout ----------
+    def _build_header(self) -> None:
+        header = ttk.Frame(self.parent, style="Header.TFrame", padding=(16, 10))
+        header.pack(fill="x")
+        ttk.Label(header, text="FocusWell — Home", font=("Segoe UI", 14, "bold")).pack(side="left")
+
+        theme_box = ttk.Combobox(header, textvariable=self.theme_var, values=["Dark", "Light", "Custom"], width=8, state="readonly")
+        theme_box.pack(side="right", padx=(6, 0))
+        ttk.Button(header, text="🎨 Colors…", command=self._pick_colors).pack(side="right", padx=(10, 0))
+        theme_box.bind("<<ComboboxSelected>>", self._schedule_theme)
+
+    def _build_timer_card(self, top: ttk.Frame) -> None:
+        # Card 1: Clock + Timer
+        card1 = ttk.Frame(top, style="Card.TFrame", padding=16)
+        card1.pack(side="left", fill="x", expand=True)
+
+        ttk.Label(card1, text="🕒 Current time (Settings > Time Zone)", style="Card.TLabel", font=("Segoe UI", 10, "bold")).pack(anchor="w")
+        ttk.Label(card1, textvariable=self.time_var, style="Card.TLabel", font=("Consolas", 32, "bold")).pack(anchor="w")
+        ttk.Label(card1, textvariable=self.date_var, style="Card.TLabel", font=("Consolas", 11)).pack(anchor="w", pady=(0, 8))
+
+        timer_box = ttk.Frame(card1, style="Card.TFrame"); timer_box.pack(fill="x", pady=(6,0))
+        ttk.Label(timer_box, text="Focus Timer ⏱️", style="Card.TLabel", font=("Segoe UI", 13, "bold")).grid(row=0, column=0, columnspan=4, sticky="w", pady=(0,8))
+        ttk.Label(timer_box, text="Phase:", style="Card.TLabel").grid(row=1, column=0, sticky="w")
+        ttk.Label(timer_box, textvariable=self.phase_var, style="Card.TLabel", font=("Segoe UI", 12, "bold")).grid(row=1, column=1, sticky="w", padx=(8,0))
+        ttk.Label(timer_box, text="Time remaining:", style="Card.TLabel").grid(row=2, column=0, sticky="w")
+        ttk.Label(timer_box, textvariable=self.remain_var, style="Card.TLabel", font=("Consolas", 16)).grid(row=2, column=1, sticky="w", padx=(8,0))
+
+        self.routines = {
+            "Demo 10/5 (quick test)": (DEMO_WORK_SEC, DEMO_BREAK_SEC),
+            "Pomodoro 25/5 (standard)": (DEFAULT_WORK_SEC, DEFAULT_BREAK_SEC),
+            "Deep work 50/10": (50*60, 10*60),
+        }
+        self.routine_var = tk.StringVar(value="Pomodoro 25/5 (standard)")
+        ttk.Label(timer_box, text="Routine (work/break):", style="Card.TLabel").grid(row=3, column=0, sticky="w", pady=(6,0))
+        ttk.Combobox(timer_box, textvariable=self.routine_var, values=list(self.routines.keys()), state="readonly", width=22).grid(row=3, column=1, sticky="w", pady=(6,0))
+
+        btns = ttk.Frame(timer_box, style="Card.TFrame"); btns.grid(row=4, column=0, columnspan=4, sticky="w", pady=10)
+        self.start_btn = ttk.Button(btns, text="Start focus", style="Accent.TButton")
+        self.pause_btn = ttk.Button(btns, text="Pause", state="disabled")
+        self.reset_btn = ttk.Button(btns, text="Reset", state="disabled")
+        self.start_btn.pack(side="left"); self.pause_btn.pack(side="left", padx=8); self.reset_btn.pack(side="left")
+
+    def _build_hydration_card(self, top: ttk.Frame) -> None:
+        # Card 2: Hydration
+        card2 = ttk.Frame(top, style="Card2.TFrame", padding=16)
+        card2.pack(side="right", fill="y", padx=(12,0))
+        ttk.Label(card2, text="Hydration 💧", style="Card2.TLabel", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,4))
+        self.hyd_info_var = tk.StringVar()
+        ttk.Label(card2, textvariable=self.hyd_info_var, style="Card2.TLabel").pack(anchor="w")
+        self.hyd_progress = ttk.Progressbar(card2, maximum=100, mode="determinate", style="Green.Horizontal.TProgressbar")
+        self.hyd_progress.pack(fill="x", pady=6)
+
+        ttk.Button(card2, text="+1 glass (≈250 ml)", command=self._add_glass).pack(anchor="w")
+        self._refresh_hydration()
+        add_listener = getattr(hc, "add_change_listener", None) or getattr(hc, "add_on_change_listener", None)
+        if callable(add_listener): add_listener(self._refresh_hydration)
+
+    def _build_calendar(self, bottom: ttk.Frame, pal: Dict[str,str]) -> None:
+        cal_card = ttk.Frame(bottom, style="Card.TFrame", padding=12)
+        cal_card.pack(side="left", fill="y", padx=(0,12))
+        ttk.Label(cal_card, text="📅 Calendar", style="Card.TLabel", font=("Segoe UI", 11, "bold")).pack(anchor="w")
+
+        if _HAS_TKCAL:
+            self.cal = Calendar(cal_card, selectmode="day", date_pattern="yyyy-mm-dd")
+            self.cal.selection_set(self.selected_date.get()); self.cal.pack(pady=4)
+            self.cal.bind("<<CalendarSelected>>", self._on_date)
+            _style_calendar(self.cal, pal)
+        else:
+            ttk.Entry(cal_card, textvariable=self.selected_date, width=12).pack(anchor="w")
+            ttk.Label(cal_card, text="Format: YYYY-MM-DD", style="Card.TLabel").pack(anchor="w")
+
+    def _build_lists(self, bottom: ttk.Frame) -> None:
+        lists_card = ttk.Frame(bottom, style="Card.TFrame", padding=12)
+        lists_card.pack(side="left", fill="both", expand=True)
+
+        day_frame = ttk.LabelFrame(lists_card, text="Tasks on selected date", style="Card.TLabelframe", padding=12)
+        day_frame.pack(fill="x")
+
+        add_row = ttk.Frame(day_frame, style="Card.TFrame"); add_row.pack(fill="x", pady=(0,8))
+        self.title_var = tk.StringVar()
+        ttk.Entry(add_row, textvariable=self.title_var).pack(side="left", fill="x", expand=True)
+        ttk.Button(add_row, text="Add task & time", command=self._add_with_time).pack(side="left", padx=6)
+
+        day_list = ttk.Frame(day_frame, style="Card.TFrame"); day_list.pack(fill="x")
+
+        next_frame = ttk.LabelFrame(lists_card, text="Next tasks (after selected date)", style="Card.TLabelframe", padding=12)
+        next_frame.pack(fill="both", expand=True, pady=(8,0))
+        next_list = ttk.Frame(next_frame, style="Card.TFrame"); next_list.pack(fill="both", expand=True)
+
+        row_actions = (self._toggle, self._set_time, self._clear_time, self._delete)
+        self.day_rows = _TaskList(day_list, *row_actions)
+        self.next_rows = _TaskList(next_list, *row_actions)
+
+    # ---------- theme ----------
+    def _apply_theme(self, *_) -> Dict[str,str]:
+        """Apply the selected theme and return its palette."""
+        mode = self.theme_var.get()
+        bg = self._bg_custom if mode == "Custom" else None
+        fg = self._fg_custom if mode == "Custom" else None
+        # skip the full ttk restyle when nothing visible would change
+        key = (mode, bg, fg)
+        if self._theme_key == key:
+            return self._theme_pal
         if _HAS_CTK:
             ctk.set_appearance_mode("Dark" if mode == "Dark" else "Light")
-        pal = _palette(mode, _bg_custom["v"] if mode == "Custom" else None, _fg_custom["v"] if mode == "Custom" else None)
-        _apply_styles(parent.winfo_toplevel(), pal)
-        cal = locals_container.get("cal_widget")
-        if _HAS_TKCAL and cal is not None:
-            _style_calendar(cal, pal)
-
-    def _pick_colors():
-        if theme_var.get() != "Custom":
-            theme_var.set("Custom")
+        pal = _palette(mode, bg, fg)
+        _apply_styles(self.root, pal)
+        if _HAS_TKCAL and self.cal is not None:
+            _style_calendar(self.cal, pal)
+        self._theme_key, self._theme_pal = key, pal
+        return pal
+
+    def _pick_colors(self) -> None:
+        if self.theme_var.get() != "Custom":
+            self.theme_var.set("Custom")
         bg = colorchooser.askcolor(title="Choose background color")
-        if bg and bg[1]: _bg_custom["v"] = bg[1]
+        if bg and bg[1]: self._bg_custom = bg[1]
         fg = colorchooser.askcolor(title="Choose text color")
-        if fg and fg[1]: _fg_custom["v"] = fg[1]
-        _apply_theme()
-
-    ttk.Button(header, text="🎨 Colors…", command=_pick_colors).pack(side="right", padx=(10, 0))
-    theme_box.bind("<<ComboboxSelected>>", _apply_theme)
-    _apply_theme()
-
-    # body (cards)
-    wrapper = ttk.Frame(parent, padding=16); wrapper.pack(fill="both", expand=True)
-    top = ttk.Frame(wrapper); top.pack(fill="x", pady=(0,12))
-
-    # Card 1: Clock + Timer
-    card1 = ttk.Frame(top, style="Card.TFrame", padding=16)
-    card1.pack(side="left", fill="x", expand=True)
-
-    ttk.Label(card1, text="🕒 Current time (Settings > Time Zone)", style="Card.TLabel", font=("Segoe UI", 10, "bold")).pack(anchor="w")
-    ttk.Label(card1, textvariable=time_var, style="Card.TLabel", font=("Consolas", 32, "bold")).pack(anchor="w")
-    ttk.Label(card1, textvariable=date_var, style="Card.TLabel", font=("Consolas", 11)).pack(anchor="w", pady=(0, 8))
-
-    timer_box = ttk.Frame(card1, style="Card.TFrame"); timer_box.pack(fill="x", pady=(6,0))
-    ttk.Label(timer_box, text="Focus Timer ⏱️", style="Card.TLabel", font=("Segoe UI", 13, "bold")).grid(row=0, column=0, columnspan=4, sticky="w", pady=(0,8))
-    ttk.Label(timer_box, text="Phase:", style="Card.TLabel").grid(row=1, column=0, sticky="w")
-    ttk.Label(timer_box, textvariable=phase_var, style="Card.TLabel", font=("Segoe UI", 12, "bold")).grid(row=1, column=1, sticky="w", padx=(8,0))
-    ttk.Label(timer_box, text="Time remaining:", style="Card.TLabel").grid(row=2, column=0, sticky="w")
-    ttk.Label(timer_box, textvariable=remain_var, style="Card.TLabel", font=("Consolas", 16)).grid(row=2, column=1, sticky="w", padx=(8,0))
-
-    routines = {
-        "Demo 10/5 (quick test)": (DEMO_WORK_SEC, DEMO_BREAK_SEC),
-        "Pomodoro 25/5 (standard)": (DEFAULT_WORK_SEC, DEFAULT_BREAK_SEC),
-        "Deep work 50/10": (50*60, 10*60),
-    }
-    routine_var = tk.StringVar(value="Pomodoro 25/5 (standard)")
-    ttk.Label(timer_box, text="Routine (work/break):", style="Card.TLabel").grid(row=3, column=0, sticky="w", pady=(6,0))
-    ttk.Combobox(timer_box, textvariable=routine_var, values=list(routines.keys()), state="readonly", width=22).grid(row=3, column=1, sticky="w", pady=(6,0))
-
-    btns = ttk.Frame(timer_box, style="Card.TFrame"); btns.grid(row=4, column=0, columnspan=4, sticky="w", pady=10)
-    start_btn = ttk.Button(btns, text="Start focus", style="Accent.TButton")
-    pause_btn = ttk.Button(btns, text="Pause", state="disabled")
-    reset_btn = ttk.Button(btns, text="Reset", state="disabled")
-    start_btn.pack(side="left"); pause_btn.pack(side="left", padx=8); reset_btn.pack(side="left")
-
-    # Card 2: Hydration
-    card2 = ttk.Frame(top, style="Card2.TFrame", padding=16)
-    card2.pack(side="right", fill="y", padx=(12,0))
-    ttk.Label(card2, text="Hydration 💧", style="Card2.TLabel", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,4))
-    hyd_info_var = tk.StringVar()
-    ttk.Label(card2, textvariable=hyd_info_var, style="Card2.TLabel").pack(anchor="w")
-    hyd_progress = ttk.Progressbar(card2, maximum=100, mode="determinate", style="Green.Horizontal.TProgressbar")
-    hyd_progress.pack(fill="x", pady=6)
-
-    def _refresh_hydration():
-        ratio = hc.get_progress_ratio()
-        _prog_target["v"] = int(ratio*100)
-        hyd_info_var.set(f"Goal: {hc.get_goal_glasses()} glasses • Progress: {hc.get_total_glasses()} / {hc.get_goal_glasses()} ({int(ratio*100)}%)")
-
-    def _add_glass():
-        hc.add_glass(); _refresh_hydration()
-        show_toast(parent.winfo_toplevel(), "➕ +250 ml added", 1000)
-
-    ttk.Button(card2, text="+1 glass (≈250 ml)", command=_add_glass).pack(anchor="w")
-    _refresh_hydration()
-    add_listener = getattr(hc, "add_change_listener", None) or getattr(hc, "add_on_change_listener", None)
-    if callable(add_listener): add_listener(_refresh_hydration)
-
-    # Bottom: Calendar + Lists
-    bottom = ttk.Frame(wrapper); bottom.pack(fill="both", expand=True)
-    selected_date = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
-
-    cal_card = ttk.Frame(bottom, style="Card.TFrame", padding=12)
-    cal_card.pack(side="left", fill="y", padx=(0,12))
-    ttk.Label(cal_card, text="📅 Calendar", style="Card.TLabel", font=("Segoe UI", 11, "bold")).pack(anchor="w")
-
-    if _HAS_TKCAL:
-        cal = Calendar(cal_card, selectmode="day", date_pattern="yyyy-mm-dd")
-        cal.selection_set(selected_date.get()); cal.pack(pady=4)
-        locals_container["cal_widget"] = cal
-        def _on_date(_evt=None):
-            selected_date.set(cal.get_date()); refresh_day(); refresh_next()
-        cal.bind("<<CalendarSelected>>", _on_date)
-        _apply_theme()
-    else:
-        ttk.Entry(cal_card, textvariable=selected_date, width=12).pack(anchor="w")
-        ttk.Label(cal_card, text="Format: YYYY-MM-DD", style="Card.TLabel").pack(anchor="w")
-
-    lists_card = ttk.Frame(bottom, style="Card.TFrame", padding=12)
-    lists_card.pack(side="left", fill="both", expand=True)
-
-    day_frame = ttk.LabelFrame(lists_card, text="Tasks on selected date", style="Card.TLabelframe", padding=12)
-    day_frame.pack(fill="x")
-
-    add_row = ttk.Frame(day_frame, style="Card.TFrame"); add_row.pack(fill="x", pady=(0,8))
-    title_var = tk.StringVar()
-    ttk.Entry(add_row, textvariable=title_var).pack(side="left", fill="x", expand=True)
-
-    def _ask_time(root: tk.Tk, title: str="Pick a time", initial: str="09:00") -> Optional[str]:
-        dlg = tk.Toplevel(root); dlg.title(title); dlg.transient(root); dlg.grab_set(); dlg.resizable(False, False)
-        vh = tk.StringVar(value=initial.split(':')[0]); vm = tk.StringVar(value=initial.split(':')[1])
-        frm = ttk.Frame(dlg, padding=12); frm.pack()
-        ttk.Label(frm, text="Hour").grid(row=0, column=0)
-        ttk.Spinbox(frm, from_=0, to=23, textvariable=vh, width=3, wrap=True, justify="center").grid(row=0, column=1, padx=4)
-        ttk.Label(frm, text=":").grid(row=0, column=2)
-        ttk.Spinbox(frm, from_=0, to=59, textvariable=vm, width=3, wrap=True, justify="center").grid(row=0, column=3, padx=4)
-        res = {"v": None}
-        def ok():
-            try:
-                h = max(0, min(23, int(vh.get()))); m = max(0, min(59, int(vm.get())))
-                res["v"] = f"{h:02d}:{m:02d}"; dlg.destroy()
-            except: dlg.destroy()
-        ttk.Button(frm, text="OK", command=ok).grid(row=1, column=0, columnspan=4, pady=(10,0))
-        dlg.bind("<Return>", lambda e: ok()); dlg.wait_window(); return res["v"]
-
-    def _add_with_time():
-        t = title_var.get().strip()
-        if not t: show_toast(parent.winfo_toplevel(), "Please enter a task title", 1500); return
-        picked = _ask_time(parent.winfo_toplevel(), "Set time for task", "09:00")
-        if not picked: return
-        pc.add_task(t, due_date=selected_date.get(), due_time=picked)
-        title_var.set(""); refresh_day(); refresh_next()
-        show_toast(parent.winfo_toplevel(), f"🆕 Task added at {picked}", 1200)
-
-    ttk.Button(add_row, text="Add task & time", command=_add_with_time).pack(side="left", padx=6)
-
-    day_list = ttk.Frame(day_frame, style="Card.TFrame"); day_list.pack(fill="x")
-
-    next_frame = ttk.LabelFrame(lists_card, text="Next tasks (after selected date)", style="Card.TLabelframe", padding=12)
-    next_frame.pack(fill="both", expand=True, pady=(8,0))
-    next_list = ttk.Frame(next_frame, style="Card.TFrame"); next_list.pack(fill="both", expand=True)
-
-    def _set_time(task_id: int):
-        picked = _ask_time(parent.winfo_toplevel(), "Set new time", "09:00")
-        if not picked: return
-        pc.update_task_time(task_id, picked); refresh_day(); refresh_next()
-        show_toast(parent.winfo_toplevel(), f"⏰ Time set to {picked}", 1200)
-
-    def _clear_time(task_id: int):
-        pc.update_task_time(task_id, None); refresh_day(); refresh_next()
-        show_toast(parent.winfo_toplevel(), "🧹 Time cleared", 1200)
-
-    def _row(container: ttk.Frame, task):
-        row = ttk.Frame(container, style="Card.TFrame"); row.pack(fill="x", pady=2)
-        done_v = tk.BooleanVar(value=task.done)
-        def toggle(): pc.toggle_done(task.id, done_v.get()); refresh_day(); refresh_next()
-        ttk.Checkbutton(row, variable=done_v, command=toggle).pack(side="left", ipadx=4, padx=(0,6))
-        ttk.Label(row, text=(task.due_date or "—"), width=12, font=("Consolas", 10), style="Card.TLabel").pack(side="left")
-        ttk.Label(row, text=(task.due_time or "—"), width=6, font=("Consolas", 10), style="Card.TLabel").pack(side="left")
-        ttk.Label(row, text=task.title, width=40, style="Card.TLabel").pack(side="left")
-        act = ttk.Frame(row, style="Card.TFrame"); act.pack(side="left", padx=6)
-        ttk.Button(act, text="Set time", command=lambda tid=task.id: _set_time(tid)).pack(side="left", padx=(0,6))
-        ttk.Button(act, text="Clear time", command=lambda tid=task.id: _clear_time(tid)).pack(side="left", padx=(0,6))
-        ttk.Button(act, text="Delete task", command=lambda tid=task.id: (pc.delete_task(tid), refresh_day(), refresh_next(), show_toast(parent.winfo_toplevel(), "🗑️ Task deleted", 1000))).pack(side="left")
-
-    def refresh_day():
-        for w in day_list.winfo_children(): w.destroy()
-        items = pc.list_tasks_by_date(selected_date.get())
-        if not items:
-            ttk.Label(day_list, text=f"(No tasks on {selected_date.get()})", style="Card.TLabel").pack(anchor="w", pady=4); return
-        hdr = ttk.Frame(day_list, style="Card.TFrame"); hdr.pack(fill="x", pady=(0,6))
-        ttk.Label(hdr, text="Done", width=6, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Date", width=8, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Time", width=6, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Title", width=40, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Actions", style="Card.TLabel").pack(side="left", padx=8)
-        for t in items: _row(day_list, t)
-
-    def refresh_next():
-        for w in next_list.winfo_children(): w.destroy()
-        items = pc.list_tasks_after_date(selected_date.get(), limit=100)
-        if not items:
-            ttk.Label(next_list, text="(No upcoming tasks)", style="Card.TLabel").pack(anchor="w", pady=4); return
-        hdr = ttk.Frame(next_list, style="Card.TFrame"); hdr.pack(fill="x", pady=(0,6))
-        ttk.Label(hdr, text="Done", width=6, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Date", width=8, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Time", width=6, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Title", width=40, style="Card.TLabel").pack(side="left")
-        ttk.Label(hdr, text="Actions", style="Card.TLabel").pack(side="left", padx=8)
-        for t in items: _row(next_list, t)
-
-    refresh_day(); refresh_next()
-
-    # focus wiring
-    def _on_update():
-        phase_var.set(ctrl.get_phase())
-        remain_var.set(_fmt_mmss(ctrl.get_remaining_sec()))
-        running = ctrl.is_running()
-        pause_btn.configure(state="normal" if running else "disabled")
-        reset_btn.configure(state="normal" if ctrl.get_phase()!="IDLE" else "disabled")
-
-    def _on_phase_change(ph: str):
-        if ph == "WORK": show_toast(parent.winfo_toplevel(), "🟢 Work phase started", 1800)
-        elif ph == "BREAK": show_toast(parent.winfo_toplevel(), "🟡 Break phase — relax", 1800)
-
-    ctrl.set_on_update(_on_update); ctrl.set_on_phase_change(_on_phase_change)
-    start_btn.configure(command=lambda: (ctrl.set_routine(*routines[routine_var.get()]), ctrl.start()))
-    pause_btn.configure(command=lambda: ctrl.pause())
-    reset_btn.configure(command=lambda: ctrl.reset())
-
-    # ✅ CRITICAL: connect controller to the global 1s loop so time actually ticks
-    add_tick_listener(ctrl.on_tick)
-
-    # live clock + smooth hydration bar
-    def _tick(total_seconds: int):
-        _update_now(date_var, time_var)
-        # Focus controller is ticked via add_tick_listener(ctrl.on_tick) above.
-
-        cur, tgt = _prog_actual["v"], _prog_target["v"]
+        if fg and fg[1]: self._fg_custom = fg[1]
+        self._apply_theme()
+
+    # ---------- hydration ----------
+    # smooth hydration bar: one after() chain, alive only while moving
+    def _animate_bar(self) -> None:
+        bar = self.bar
+        cur, tgt = bar.actual, bar.target
         new_val = _animate(cur, tgt, step=2.5)
-        _prog_actual["v"] = new_val
-        hyd_progress["value"] = new_val
+        bar.actual = new_val
+        self.hyd_progress["value"] = new_val
         if abs(tgt - new_val) > 0.1:
-            parent.after(16, lambda: _tick(total_seconds))
+            self._bar_job = self.parent.after(16, self._animate_bar)
+        else:
+            self._bar_job = None
+            bar.running = False
+
+    def _refresh_hydration(self) -> None:
+        version = hc.get_version()
+        if version == self._hyd_version:
+            return   # nothing rendered here changed (e.g. intake already capped)
+        self._hyd_version = version
+        bar = self.bar
+        total, goal, ratio = hc.get_snapshot()
+        bar.target = int(ratio*100)
+        if not bar.running and bar.actual != bar.target:
+            bar.running = True
+            self._animate_bar()
+        self.hyd_info_var.set(f"Goal: {goal} glasses • Progress: {total} / {goal} ({int(ratio*100)}%)")
+
+    def _add_glass(self) -> None:
+        hc.add_glass(); self._refresh_hydration()
+        show_toast(self.root, "➕ +250 ml added", 1000)
+
+    # ---------- tasks ----------
+    def _on_date(self, _evt=None) -> None:
+        self.selected_date.set(self.cal.get_date()); self.refresh_day(); self.refresh_next()
+
+    def _ask_time(self, title: str="Pick a time", initial: str="09:00") -> Optional[str]:
+        # one hidden dialog, built on first use and re-shown afterwards
+        if self._time_dlg is None:
+            dlg = tk.Toplevel(self.root); dlg.withdraw(); dlg.transient(self.root); dlg.resizable(False, False)
+            vh = tk.StringVar(); vm = tk.StringVar(); res = tk.StringVar()
+            frm = ttk.Frame(dlg, padding=12); frm.pack()
+            ttk.Label(frm, text="Hour").grid(row=0, column=0)
+            ttk.Spinbox(frm, from_=0, to=23, textvariable=vh, width=3, wrap=True, justify="center").grid(row=0, column=1, padx=4)
+            ttk.Label(frm, text=":").grid(row=0, column=2)
+            ttk.Spinbox(frm, from_=0, to=59, textvariable=vm, width=3, wrap=True, justify="center").grid(row=0, column=3, padx=4)
+            def ok():
+                try:
+                    h = max(0, min(23, int(vh.get()))); m = max(0, min(59, int(vm.get())))
+                    res.set(f"{h:02d}:{m:02d}")
+                except: res.set("")
+            ttk.Button(frm, text="OK", command=ok).grid(row=1, column=0, columnspan=4, pady=(10,0))
+            dlg.bind("<Return>", lambda e: ok())
+            dlg.protocol("WM_DELETE_WINDOW", lambda: res.set(""))
+            self._time_dlg = (dlg, vh, vm, res)
+        dlg, vh, vm, res = self._time_dlg
+        dlg.title(title); vh.set(initial.split(':')[0]); vm.set(initial.split(':')[1])
+        dlg.deiconify(); dlg.grab_set()
+        dlg.wait_variable(res)   # set by OK / <Return> / window close
+        dlg.grab_release(); dlg.withdraw()
+        return res.get() or None
+
+    def _add_with_time(self) -> None:
+        t = self.title_var.get().strip()
+        if not t: show_toast(self.root, "Please enter a task title", 1500); return
+        picked = self._ask_time("Set time for task", "09:00")
+        if not picked: return
+        pc.add_task(t, due_date=self.selected_date.get(), due_time=picked)
+        self.title_var.set(""); self.refresh_day(); self.refresh_next()
+        show_toast(self.root, f"🆕 Task added at {picked}", 1200)
 
-    add_tick_listener(_tick)
-    _on_update()
+    def _set_time(self, task_id: int) -> None:
+        picked = self._ask_time("Set new time", "09:00")
+        if not picked: return
+        pc.update_task_time(task_id, picked); self.refresh_day(); self.refresh_next()
+        show_toast(self.root, f"⏰ Time set to {picked}", 1200)
+
+    def _clear_time(self, task_id: int) -> None:
+        pc.update_task_time(task_id, None); self.refresh_day(); self.refresh_next()
+        show_toast(self.root, "🧹 Time cleared", 1200)
+
+    def _toggle(self, task_id: int, done: bool) -> None:
+        pc.toggle_done(task_id, done); self.refresh_day(); self.refresh_next()
+
+    def _delete(self, task_id: int) -> None:
+        pc.delete_task(task_id); self.refresh_day(); self.refresh_next()
+        show_toast(self.root, "🗑️ Task deleted", 1000)
+
+    def refresh_day(self) -> None:
+        day = self.selected_date.get()
+        self.day_rows.show(pc.list_tasks_by_date(day), f"(No tasks on {day})")
+
+    def refresh_next(self) -> None:
+        self.next_rows.show(pc.list_tasks_after_date(self.selected_date.get(), limit=100), "(No upcoming tasks)")
+
+    # ---------- focus timer ----------
+    def _start(self) -> None:
+        self.ctrl.set_routine(*self.routines[self.routine_var.get()]); self.ctrl.start()
+
+    def _on_update(self) -> None:
+        ctrl = self.ctrl
+        phase, remaining, running = ctrl.get_phase(), ctrl.get_remaining_sec(), ctrl.is_running()
+        if remaining != self._shown_remaining:
+            self._shown_remaining = remaining
+            self.remain_var.set(_fmt_mmss(remaining))
+        if phase != self._shown_phase:
+            self._shown_phase = phase
+            self.phase_var.set(str(phase))
+            self.reset_btn.configure(state="normal" if phase!=Phase.IDLE else "disabled")
+        if running != self._shown_running:
+            self._shown_running = running
+            self.pause_btn.configure(state="normal" if running else "disabled")
+
+    def _on_phase_change(self, ph: Phase) -> None:
+        if ph == Phase.WORK: show_toast(self.root, "🟢 Work phase started", 1800)
+        elif ph == Phase.BREAK: show_toast(self.root, "🟡 Break phase — relax", 1800)
+
+    # live clock: self-scheduled on the wall-clock second boundary (no drift,
+    # independent of the AppLoop tick; the hydration bar has its own chain too)
+    def _clock_tick(self) -> None:
+        _update_now(self.date_var, self.time_var)
+        self._clock_job = self.parent.after(1000 - datetime.now().microsecond // 1000, self._clock_tick)
+
+    def _on_destroy(self, e) -> None:
+        if e.widget is not self.parent:
+            return
+        for job in (self._clock_job, self._bar_job):
+            if job is not None:
+                try:
+                    self.parent.after_cancel(job)
+                except tk.TclError:
+                    pass
+        self._clock_job = self._bar_job = None
+
+
+def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]], None]) -> HomeView:
+    """Build the Home screen inside `parent` and return its HomeView."""
+    return HomeView(parent, add_tick_listener)
 
 
 def _update_now(dv: tk.StringVar, tv: tk.StringVar):
@@ -12,7 +12,7 @@ reset hydration state when settings change.
 """
 
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 # ------------------------------------------------------------
 # Constants
@@ -46,31 +46,48 @@ class HydrationState:
     goal_ml: int
     total_ml: int
     profile: HydrationProfile
+    # Derived values, refreshed by `_update_derived()` after each mutation
+    goal_glasses: int = 0
+    total_glasses: int = 0
+    ratio: float = 0.0
+    # Bumped whenever goal_ml / total_ml (everything listeners render) changes
+    version: int = 0
 
 
 # ------------------------------------------------------------
 # Goal computation
 # ------------------------------------------------------------
+def _combined_permille(climate: str, activity: str) -> int:
+    return int(round(_CLIMATE_FACTORS.get(climate, 1.0) * _ACTIVITY_FACTORS.get(activity, 1.0) * 1000))
+
+
+# Climate × activity multiplier per pair, in thousandths (integer math below)
+_COMBINED_PERMILLE = {
+    (c, a): _combined_permille(c, a) for c in _CLIMATE_FACTORS for a in _ACTIVITY_FACTORS
+}
+
+
 def _compute_goal_ml(profile: HydrationProfile) -> int:
     """
     Compute daily hydration goal (ml) based on profile.
     """
-    # 1) Weight-based (≈35 ml/kg) or baseline per gender
+    # 1) Weight-based (≈35 ml/kg) or baseline per gender, in tenths of a ml
+    #    (weights are typed to 0.1 kg, so this keeps the float formula's precision)
     if profile.weight_kg and profile.weight_kg > 0:
-        base = profile.weight_kg * 35.0
+        base = int(round(profile.weight_kg * 350))
     else:
-        base = _MALE_BASE_ML if profile.sex.lower() == "male" else _FEMALE_BASE_ML
+        base = 10 * (_MALE_BASE_ML if profile.sex.lower() == "male" else _FEMALE_BASE_ML)
 
-    # 2) Adjust for climate
-    base *= _CLIMATE_FACTORS.get(profile.climate, 1.0)
+    # 2) Adjust for climate and activity (one precomputed factor), rounding
+    #    once; halves go to even like round() did
+    key = (profile.climate, profile.activity)
+    factor = _COMBINED_PERMILLE.get(key) or _combined_permille(*key)
+    goal, rem = divmod(base * factor, 10000)
+    if rem > 5000 or (rem == 5000 and goal & 1):
+        goal += 1
 
-    # 3) Adjust for activity
-    base *= _ACTIVITY_FACTORS.get(profile.activity, 1.0)
-
-    # 4) Clamp to safe limits (1.2–6.0 L)
-    goal = int(round(base))
-    goal = max(1200, min(goal, 6000))
-    return goal
+    # 3) Clamp to safe limits (1.2–6.0 L)
+    return 1200 if goal < 1200 else 6000 if goal > 6000 else goal
 
 
 # ------------------------------------------------------------
@@ -79,11 +96,36 @@ def _compute_goal_ml(profile: HydrationProfile) -> int:
 _profile = HydrationProfile()
 _state = HydrationState(goal_ml=_compute_goal_ml(_profile), total_ml=0, profile=_profile)
 
+
+_derived_key: Tuple[int, int] | None = None
+
+
+def _update_derived() -> bool:
+    """
+    Recompute glasses / progress ratio from goal_ml and total_ml.
+    Returns False (and leaves `version` alone) when neither value changed.
+    """
+    global _derived_key
+    key = (_state.goal_ml, _state.total_ml)
+    if key == _derived_key:
+        return False
+    _derived_key = key
+    _state.goal_glasses = _state.goal_ml // GLASS_ML
+    _state.total_glasses = _state.total_ml // GLASS_ML
+    _state.ratio = min(_state.total_ml / _state.goal_ml, 1.0) if _state.goal_ml > 0 else 0.0
+    _state.version += 1
+    return True
+
+
+_update_derived()
+
 _listeners: List[Callable[[], None]] = []
+# Immutable copy iterated by `_emit_change`; rebuilt only on add/remove
+_listeners_snapshot: Tuple[Callable[[], None], ...] = ()
 
 
 def _emit_change():
-    for cb in list(_listeners):
+    for cb in _listeners_snapshot:
         try:
             cb()
         except Exception:
@@ -95,18 +137,30 @@ def _emit_change():
 # ------------------------------------------------------------
 def add_change_listener(cb: Callable[[], None]) -> None:
     """UI can register here for auto-refresh on hydration state change."""
+    global _listeners_snapshot
     if cb not in _listeners:
         _listeners.append(cb)
+        _listeners_snapshot = tuple(_listeners)
 
 def remove_change_listener(cb: Callable[[], None]) -> None:
+    global _listeners_snapshot
     if cb in _listeners:
         _listeners.remove(cb)
+        _listeners_snapshot = tuple(_listeners)
 
 # Backward compatibility
 add_on_change_listener = add_change_listener
 remove_on_change_listener = remove_change_listener
 
 
+def climate_from_temperature(temp_c: float) -> str:
+    """Convert ambient temperature (°C) into a climate category."""
+    if temp_c <= 10:
+        return "cool"
+    if temp_c >= 25:
+        return "hot"
+    return "temperate"
+
 def set_profile(
     sex: str | None = None,
     weight_kg: float | None = None,
@@ -132,7 +186,8 @@ def set_profile(
             _state.profile.activity = a
 
     _state.goal_ml = _compute_goal_ml(_state.profile)
-    _emit_change()
+    if _update_derived():
+        _emit_change()
 
 def get_profile() -> HydrationProfile:
     return _state.profile
@@ -141,27 +196,35 @@ def get_goal_ml() -> int:
     return _state.goal_ml
 
 def get_goal_glasses() -> int:
-    return _state.goal_ml // GLASS_ML
+    return _state.goal_glasses
 
 def get_total_ml() -> int:
     return _state.total_ml
 
 def get_total_glasses() -> int:
-    return _state.total_ml // GLASS_ML
+    return _state.total_glasses
 
 def get_progress_ratio() -> float:
-    if _state.goal_ml <= 0:
-        return 0.0
-    return min(_state.total_ml / _state.goal_ml, 1.0)
+    return _state.ratio
+
+def get_snapshot() -> Tuple[int, int, float]:
+    """(total_glasses, goal_glasses, ratio) in one call, from the cached state."""
+    return _state.total_glasses, _state.goal_glasses, _state.ratio
+
+def get_version() -> int:
+    """Counter bumped on every observable goal/intake change."""
+    return _state.version
 
 def add_glass() -> None:
     """Add one glass (250 ml) and notify listeners."""
     _state.total_ml += GLASS_ML
     if _state.total_ml > 10_000:
         _state.total_ml = 10_000
-    _emit_change()
+    if _update_derived():
+        _emit_change()
 
 def reset_today() -> None:
     """Reset daily intake (e.g., new day)."""
     _state.total_ml = 0
-    _emit_change()
+    if _update_derived():
+        _emit_change()
@@ -7,10 +7,54 @@ Handles CRUD operations and sorting for tasks stored in SQLite
 via core/db.py, including filtering by date and listing upcoming tasks.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from core import db
 from features.planner.model import Task
 
+# ------------------------------------------------------------
+# SQL (module constants: identical text → sqlite3 statement-cache hits)
+# ------------------------------------------------------------
+# Empty due_date / due_time are stored as NULL (see core.db migration v2);
+# `x IS NULL` sorts undated/untimed tasks last without wrapping the column.
+_TASK_COLUMNS = (
+    "SELECT id, title, done, created_at, updated_at, due_date, due_time FROM tasks "
+)
+_ORDER_DATE_TIME = (
+    "ORDER BY due_date IS NULL, due_date ASC, due_time IS NULL, due_time ASC, id DESC"
+)
+_ORDER_TIME = "ORDER BY due_time IS NULL, due_time ASC, id DESC"
+
+# One INSERT / one time UPDATE; missing values are bound as NULL
+_SQL_INSERT_TASK = "INSERT INTO tasks (title, due_date, due_time) VALUES (?, ?, ?)"
+_SQL_LIST_ALL = _TASK_COLUMNS + _ORDER_DATE_TIME
+_SQL_LIST_OPEN = _TASK_COLUMNS + "WHERE done=0 " + _ORDER_DATE_TIME
+_SQL_LIST_BY_DATE = _TASK_COLUMNS + "WHERE due_date = ? " + _ORDER_TIME
+_SQL_LIST_AFTER_DATE = (
+    _TASK_COLUMNS + "WHERE due_date > ? "
+    "ORDER BY due_date ASC, due_time IS NULL, due_time ASC, id DESC "
+    "LIMIT ?"
+)
+_SQL_TOGGLE_DONE = "UPDATE tasks SET done=?, updated_at=datetime('now') WHERE id=?"
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id=?"
+_SQL_SET_TIME = "UPDATE tasks SET due_time=?, updated_at=datetime('now') WHERE id=?"
+
+# ------------------------------------------------------------
+# Per-date read cache (filled by list_tasks_by_date, dropped on writes)
+# ------------------------------------------------------------
+_BY_DATE_CACHE_SIZE = 32
+_by_date_cache: dict[str, tuple[Task, ...]] = {}
+
+def _invalidate(date_iso: Optional[str] = None) -> None:
+    """Forget one cached date, or everything when the date is unknown."""
+    if date_iso is None:
+        _by_date_cache.clear()
+    else:
+        _by_date_cache.pop(date_iso, None)
+
+def clear_cache() -> None:
+    """Drop all cached reads (e.g. after the DB was changed behind our back)."""
+    _by_date_cache.clear()
+
 # ------------------------------------------------------------
 # Initialization
 # ------------------------------------------------------------
@@ -21,103 +65,95 @@ def init_storage() -> None:
 # ------------------------------------------------------------
 # CRUD operations
 # ------------------------------------------------------------
+def _task_row(title: str, due_date: Optional[str], due_time: Optional[str]) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """Normalize insert params; None for a blank title. A time needs a date."""
+    title = title.strip()
+    if not title:
+        return None
+    due_date = due_date or None
+    return title, due_date, (due_time or None) if due_date else None
+
 def add_task(title: str, due_date: Optional[str] = None, due_time: Optional[str] = None) -> int:
     """
     Add a new task.
     Optionally include due_date ('YYYY-MM-DD') and due_time ('HH:MM').
     """
-    title = title.strip()
-    if not title:
+    row = _task_row(title, due_date, due_time)
+    if not row:
         return 0
+    task_id = db.execute(_SQL_INSERT_TASK, row)
+    if row[1]:
+        _invalidate(row[1])
+    return task_id
 
-    if due_date and due_time:
-        sql = "INSERT INTO tasks (title, due_date, due_time) VALUES (?, ?, ?)"
-        return db.execute(sql, (title, due_date, due_time))
-    elif due_date:
-        sql = "INSERT INTO tasks (title, due_date) VALUES (?, ?)"
-        return db.execute(sql, (title, due_date))
-    else:
-        sql = "INSERT INTO tasks (title) VALUES (?)"
-        return db.execute(sql, (title,))
+def add_tasks_bulk(items: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> int:
+    """
+    Add many (title, due_date, due_time) tasks in one transaction.
+    Blank titles are skipped; a time without a date is dropped (as in add_task).
+    `items` may be a generator: rows are normalized and handed to
+    executemany one at a time, so memory stays bounded.
+    Returns the number of inserted tasks.
+    """
+    count = 0
+    dates: set[str] = set()
+
+    def _rows():
+        nonlocal count
+        for title, due_date, due_time in items:
+            if (title := title.strip()):
+                due_date = due_date or None
+                count += 1
+                if due_date:
+                    dates.add(due_date)
+                yield title, due_date, (due_time or None) if due_date else None
+
+    db.execute_many(_SQL_INSERT_TASK, _rows())
+    for due_date in dates:
+        _invalidate(due_date)
+    return count
 
 def list_tasks(show_done: bool = True) -> List[Task]:
     """Return all tasks, sorted by date/time."""
-    base = (
-        "SELECT id, title, done, created_at, IFNULL(updated_at,''), "
-        "IFNULL(due_date,''), IFNULL(due_time,'') FROM tasks "
-    )
-    if show_done:
-        sql = base + (
-            "ORDER BY CASE WHEN due_date='' THEN 1 ELSE 0 END, due_date ASC, "
-            "CASE WHEN due_time='' THEN 1 ELSE 0 END, due_time ASC, id DESC"
-        )
-    else:
-        sql = base + (
-            "WHERE done=0 "
-            "ORDER BY CASE WHEN due_date='' THEN 1 ELSE 0 END, due_date ASC, "
-            "CASE WHEN due_time='' THEN 1 ELSE 0 END, due_time ASC, id DESC"
-        )
-    return _rows_to_tasks(db.query_all(sql))
+    return _rows_to_tasks(db.query_all(_SQL_LIST_ALL if show_done else _SQL_LIST_OPEN))
 
 def list_tasks_by_date(date_iso: str) -> List[Task]:
     """Return all tasks with due_date = date_iso ('YYYY-MM-DD')."""
-    rows = db.query_all(
-        "SELECT id, title, done, created_at, IFNULL(updated_at,''), IFNULL(due_date,''), IFNULL(due_time,'') "
-        "FROM tasks WHERE due_date = ? "
-        "ORDER BY CASE WHEN due_time='' THEN 1 ELSE 0 END, due_time ASC, id DESC",
-        (date_iso,),
-    )
-    return _rows_to_tasks(rows)
+    cached = _by_date_cache.pop(date_iso, None)
+    if cached is None:
+        if len(_by_date_cache) >= _BY_DATE_CACHE_SIZE:
+            del _by_date_cache[next(iter(_by_date_cache))]   # least recently used
+        cached = tuple(_rows_to_tasks(db.query_all(_SQL_LIST_BY_DATE, (date_iso,))))
+    _by_date_cache[date_iso] = cached   # (re)insert as most recently used
+    return list(cached)
 
 def list_tasks_after_date(date_iso: str, limit: int = 50) -> List[Task]:
     """Return upcoming tasks after given date, ordered chronologically."""
-    rows = db.query_all(
-        "SELECT id, title, done, created_at, IFNULL(updated_at,''), IFNULL(due_date,''), IFNULL(due_time,'') "
-        "FROM tasks "
-        "WHERE due_date IS NOT NULL AND due_date <> '' AND due_date > ? "
-        "ORDER BY due_date ASC, CASE WHEN due_time='' THEN 1 ELSE 0 END, due_time ASC, id DESC "
-        f"LIMIT {int(limit)}",
-        (date_iso,),
-    )
-    return _rows_to_tasks(rows)
+    return _rows_to_tasks(db.query_all(_SQL_LIST_AFTER_DATE, (date_iso, int(limit))))
 
 def toggle_done(task_id: int, done: bool) -> None:
     """Mark a task as done or not done."""
-    sql = "UPDATE tasks SET done=?, updated_at=datetime('now') WHERE id=?"
-    db.execute(sql, (1 if done else 0, task_id))
+    db.execute(_SQL_TOGGLE_DONE, (1 if done else 0, task_id))
+    _invalidate()
 
 def delete_task(task_id: int) -> None:
     """Delete a task by ID."""
-    sql = "DELETE FROM tasks WHERE id=?"
-    db.execute(sql, (task_id,))
+    db.execute(_SQL_DELETE_TASK, (task_id,))
+    _invalidate()
 
 def update_task_time(task_id: int, due_time: Optional[str]) -> None:
     """Set or clear the time for a task ('HH:MM' or None)."""
-    if due_time:
-        sql = "UPDATE tasks SET due_time=?, updated_at=datetime('now') WHERE id=?"
-        db.execute(sql, (due_time, task_id))
-    else:
-        sql = "UPDATE tasks SET due_time=NULL, updated_at=datetime('now') WHERE id=?"
-        db.execute(sql, (task_id,))
+    db.execute(_SQL_SET_TIME, (due_time or None, task_id))
+    _invalidate()
 
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
 def _rows_to_tasks(rows: list[tuple]) -> List[Task]:
-    """Convert raw database rows into Task objects."""
-    def _norm(v: str) -> Optional[str]:
-        v = v or ""
-        return v if v.strip() else None
-
+    """
+    Convert raw database rows into Task objects (NULL columns → None).
+    Rows are unpacked positionally in `_TASK_COLUMNS` order.
+    """
     return [
-        Task(
-            id=row[0],
-            title=row[1],
-            done=bool(row[2]),
-            created_at=row[3],
-            updated_at=_norm(row[4]),
-            due_date=_norm(row[5]),
-            due_time=_norm(row[6]),
-        )
-        for row in rows
+        Task(task_id, title, bool(done), created_at, updated_at, due_date, due_time)
+        for task_id, title, done, created_at, updated_at, due_date, due_time in rows
     ]
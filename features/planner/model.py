@@ -7,7 +7,7 @@ Represents a row in the `tasks` table of the SQLite database.
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Task:
     id: int                 # Unique ID in the database
     title: str              # Task title or description
@@ -7,14 +7,18 @@ Main "Home" screen of FocusWell:
 - Handles eye and hydration reminders during active WORK sessions.
 """
 
+import time
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 from typing import Callable
 from datetime import datetime
 
+from ui.debounce import debounced
 from ui.toasts import show_toast
 from features.focus.controller import (
     FocusController,
+    Phase,
     DEMO_WORK_SEC,
     DEMO_BREAK_SEC,
     DEFAULT_WORK_SEC,
@@ -36,18 +40,21 @@ except Exception:
     _HAS_TKCAL = False
 
 
+@lru_cache(maxsize=4096)
 def _fmt_mmss(sec: int) -> str:
-    """Format seconds → MM:SS."""
+    """Format seconds → MM:SS (memoized: a session only sees a few thousand values)."""
     return f"{sec // 60:02d}:{sec % 60:02d}"
 
 
-def _generate_time_slots(step_minutes: int = 30) -> list[str]:
-    """Generate a list of HH:MM slots (00:00–23:30)."""
-    slots: list[str] = []
-    for h in range(24):
-        for m in range(0, 60, step_minutes):
-            slots.append(f"{h:02d}:{m:02d}")
-    return slots
+@lru_cache(maxsize=None)
+def _generate_time_slots(step_minutes: int = 30) -> tuple[str, ...]:
+    """Generate the HH:MM slots (00:00–23:30 for 30 min steps)."""
+    return tuple(f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, step_minutes))
+
+
+# Half-hour slots used by the time picker, built once at import
+_TIME_SLOTS_30 = _generate_time_slots(30)
+_TIME_SLOT_INDEX_30 = {slot: i for i, slot in enumerate(_TIME_SLOTS_30)}
 
 
 def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]], None]) -> None:
@@ -126,15 +133,16 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
     hyd_progress.pack(fill="x", pady=6)
 
     def _refresh_hydration():
-        total = hc.get_total_glasses()
-        goal = hc.get_goal_glasses()
-        ratio = hc.get_progress_ratio()
+        total, goal, ratio = hc.get_snapshot()
         hyd_progress["value"] = int(ratio * 100)
         hyd_info_var.set(f"Drank {total}/{goal} glasses ({int(ratio*100)}%)")
 
+    # a burst of clicks → one redraw, 50 ms after the last one
+    _refresh_hydration_soon = debounced(parent, 50, _refresh_hydration)
+
     def _add_glass():
         hc.add_glass()
-        _refresh_hydration()
+        _refresh_hydration_soon()
         show_toast(parent.winfo_toplevel(), "➕ Added 250 ml", 1200)
 
     ttk.Button(right, text="+1 glass", command=_add_glass).pack(anchor="w")
@@ -160,7 +168,7 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
 
         def _on_date_change(_evt=None):
             selected_date.set(cal.get_date())
-            refresh_day_tasks()
+            refresh_day_tasks_soon()
 
         cal.bind("<<CalendarSelected>>", _on_date_change)
     else:
@@ -177,20 +185,16 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
     ttk.Label(time_picker_frame, textvariable=selected_time, font=("Consolas", 11)).pack(anchor="w", pady=(0, 6))
 
     times_list = tk.Listbox(time_picker_frame, height=10, exportselection=False)
-    for slot in _generate_time_slots(30):
-        times_list.insert("end", slot)
+    times_list.insert("end", *_TIME_SLOTS_30)
     times_list.pack(side="left")
     sb = ttk.Scrollbar(time_picker_frame, orient="vertical", command=times_list.yview)
     sb.pack(side="left", fill="y")
     times_list.configure(yscrollcommand=sb.set)
 
     # Default select 09:00
-    try:
-        idx = list(_generate_time_slots(30)).index("09:00")
-        times_list.selection_set(idx)
-        times_list.see(idx)
-    except ValueError:
-        pass
+    idx = _TIME_SLOT_INDEX_30["09:00"]
+    times_list.selection_set(idx)
+    times_list.see(idx)
 
     def _on_time_select(_evt=None):
         sel = times_list.curselection()
@@ -209,8 +213,24 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
     ttk.Entry(add_row, textvariable=day_entry_var).pack(side="left", fill="x", expand=True)
     ttk.Button(add_row, text="Add", command=lambda: _add_day_task()).pack(side="left", padx=6)
 
-    list_container = ttk.Frame(day_frame)
-    list_container.pack(fill="both", expand=True)
+    # One Treeview for all rows: refresh swaps item values, no widgets per task.
+    # Full reload only on add / date change; toggle and time edits patch one row.
+    empty_var = tk.StringVar()
+    empty_label = ttk.Label(day_frame, textvariable=empty_var)
+    tree = ttk.Treeview(day_frame, columns=("done", "time", "title"), show="headings", height=8, selectmode="browse")
+    tree.heading("done", text="Done"); tree.column("done", width=60, anchor="center", stretch=False)
+    tree.heading("time", text="Time"); tree.column("time", width=80, anchor="center", stretch=False)
+    tree.heading("title", text="Title"); tree.column("title", width=360)
+    tree.pack(fill="both", expand=True)
+
+    actions = ttk.Frame(day_frame)
+    actions.pack(anchor="w", pady=(6, 0))
+    ttk.Button(actions, text="Set time from picker", command=lambda: _set_time_for_task(_selected_task_id())).pack(side="left")
+    ttk.Button(actions, text="Clear time", command=lambda: _clear_time_for_task(_selected_task_id())).pack(side="left", padx=(6, 0))
+
+    def _selected_task_id() -> int:
+        sel = tree.selection()
+        return int(sel[0]) if sel else 0
 
     def _add_day_task():
         title = day_entry_var.get().strip()
@@ -219,51 +239,66 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
             return
         pc.add_task(title, due_date=selected_date.get(), due_time=selected_time.get())
         day_entry_var.set("")
-        refresh_day_tasks()
+        refresh_day_tasks_soon()
         show_toast(parent.winfo_toplevel(), "🆕 Task added!", 1200)
 
+    def _sort_key(iid: str) -> tuple:
+        # same order as pc.list_tasks_by_date: untimed last, then time, newest id first
+        t = tree.set(iid, "time")
+        return (t == "--:--", t, -int(iid))
+
+    def _show_time(task_id: int, due_time: str | None):
+        # update one row in place and move it to its sorted position
+        iid = str(task_id)
+        tree.set(iid, "time", due_time or "--:--")
+        others = [c for c in tree.get_children() if c != iid]
+        key = _sort_key(iid)
+        tree.move(iid, "", sum(1 for c in others if _sort_key(c) < key))
+
     def _set_time_for_task(task_id: int):
+        if not task_id:
+            show_toast(parent.winfo_toplevel(), "Select a task first", 1500)
+            return
         pc.update_task_time(task_id, selected_time.get())
-        refresh_day_tasks()
+        _show_time(task_id, selected_time.get())
         show_toast(parent.winfo_toplevel(), f"⏰ Time set to {selected_time.get()}", 1200)
 
     def _clear_time_for_task(task_id: int):
+        if not task_id:
+            show_toast(parent.winfo_toplevel(), "Select a task first", 1500)
+            return
         pc.update_task_time(task_id, None)
-        refresh_day_tasks()
+        _show_time(task_id, None)
         show_toast(parent.winfo_toplevel(), "🧹 Time cleared", 1200)
 
-    def refresh_day_tasks():
-        for w in list_container.winfo_children():
-            w.destroy()
-
-        tasks = pc.list_tasks_by_date(selected_date.get())
-        if not tasks:
-            ttk.Label(list_container, text=f"(No tasks for {selected_date.get()})").pack(anchor="w", pady=4)
+    def _on_tree_click(evt):
+        # click in the "Done" column toggles the task under the pointer
+        if tree.identify_region(evt.x, evt.y) != "cell" or tree.identify_column(evt.x) != "#1":
             return
+        iid = tree.identify_row(evt.y)
+        if iid:
+            done = tree.set(iid, "done") != "✔"
+            pc.toggle_done(int(iid), done)
+            tree.set(iid, "done", "✔" if done else "")
 
-        hdr = ttk.Frame(list_container)
-        hdr.pack(fill="x", pady=(0, 6))
-        ttk.Label(hdr, text="Done", width=6).pack(side="left")
-        ttk.Label(hdr, text="Time", width=8).pack(side="left")
-        ttk.Label(hdr, text="Title", width=40).pack(side="left")
-        ttk.Label(hdr, text="Actions").pack(side="left", padx=8)
+    tree.bind("<Button-1>", _on_tree_click)
 
+    def refresh_day_tasks():
+        tasks = pc.list_tasks_by_date(selected_date.get())
+        sel = tree.selection()
+        tree.delete(*tree.get_children())
         for task in tasks:
-            row = ttk.Frame(list_container)
-            row.pack(fill="x", pady=2)
-            done_var = tk.BooleanVar(value=task.done)
+            tree.insert("", "end", iid=str(task.id), values=("✔" if task.done else "", task.due_time or "--:--", task.title))
+        if sel and tree.exists(sel[0]):
+            tree.selection_set(sel[0])
 
-            def make_toggle_handler(task_id: int, var: tk.BooleanVar):
-                return lambda: (pc.toggle_done(task_id, var.get()), refresh_day_tasks())
-
-            ttk.Checkbutton(row, variable=done_var, command=make_toggle_handler(task.id, done_var)).pack(side="left", ipadx=4, padx=(0, 6))
-            ttk.Label(row, text=(task.due_time or "--:--"), width=8, font=("Consolas", 10)).pack(side="left")
-            ttk.Label(row, text=task.title, width=40).pack(side="left")
+        if tasks:
+            empty_label.pack_forget()
+        else:
+            empty_var.set(f"(No tasks for {selected_date.get()})")
+            empty_label.pack(anchor="w", pady=4, before=tree)
 
-            actions = ttk.Frame(row)
-            actions.pack(side="left", padx=8)
-            ttk.Button(actions, text="Set time from picker", command=lambda tid=task.id: _set_time_for_task(tid)).pack(side="left")
-            ttk.Button(actions, text="Clear time", command=lambda tid=task.id: _clear_time_for_task(tid)).pack(side="left", padx=(6, 0))
+    refresh_day_tasks_soon = debounced(parent, 50, refresh_day_tasks)
 
     # ====== Controller + Tick ======
     def _update_buttons(running: bool):
@@ -272,18 +307,18 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
             pause_btn.configure(state="normal")
             reset_btn.configure(state="normal")
         else:
-            label = "Resume" if ctrl.get_phase() != "IDLE" and ctrl.get_remaining_sec() > 0 else "Start"
+            label = "Resume" if ctrl.get_phase() != Phase.IDLE and ctrl.get_remaining_sec() > 0 else "Start"
             start_btn.configure(text=label, state="normal")
             pause_btn.configure(state="disabled")
-            reset_btn.configure(state="normal" if ctrl.get_phase() != "IDLE" else "disabled")
+            reset_btn.configure(state="normal" if ctrl.get_phase() != Phase.IDLE else "disabled")
 
     def on_update_ui():
-        phase_var.set(ctrl.get_phase())
+        phase_var.set(str(ctrl.get_phase()))
         time_var.set(_fmt_mmss(ctrl.get_remaining_sec()))
         _update_buttons(ctrl.is_running())
 
-    def on_phase_change(phase: str):
-        msg = "🧠 Work phase started" if phase == "WORK" else "☕ Break phase — relax!"
+    def on_phase_change(phase: Phase):
+        msg = "🧠 Work phase started" if phase == Phase.WORK else "☕ Break phase — relax!"
         show_toast(parent.winfo_toplevel(), msg, 2000)
         reminder_var.set("")
 
@@ -299,37 +334,51 @@ def build(parent: ttk.Frame, add_tick_listener: Callable[[Callable[[int], None]]
     reset_btn.configure(command=lambda: (ctrl.reset(), phase_var.set("IDLE"), time_var.set("00:00"), _update_buttons(False), reminder_var.set("")))
     routine_cb.bind("<<ComboboxSelected>>", lambda e: _apply_routine())
 
-    last_eye = {"v": -1}
-    last_hyd = {"v": -1}
-
-    def _on_tick(_total_seconds: int):
-        now = datetime.now().strftime("%Y-%m-%d  %H:%M:%S")
-        dt_var.set(now)
-
-        if not ctrl.is_running() or ctrl.get_phase() != "WORK":
+    # Reminder thresholds in elapsed WORK seconds (next time each one is due)
+    next_eye = {"v": FOCUS_EYE_REMINDER_SEC}
+    next_hyd = {"v": FOCUS_HYDRATION_REMINDER_SEC}
+
+    # date prefix rebuilt only when the day rolls over; identical text is not re-set
+    clock = {"yday": -1, "date": "", "text": ""}
+
+    def _clock_tick(_total_seconds: int):
+        tm = time.localtime()
+        if tm.tm_yday != clock["yday"]:
+            clock["yday"] = tm.tm_yday
+            clock["date"] = f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}  "
+        text = f"{clock['date']}{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        if text != clock["text"]:
+            clock["text"] = text
+            dt_var.set(text)
+
+    def _due(nxt: dict, period: int, elapsed: int) -> bool:
+        """True once per period; re-arms after a reset/restart of the work phase."""
+        if elapsed < nxt["v"] - period:
+            nxt["v"] = (elapsed // period + 1) * period
+        if elapsed < nxt["v"]:
+            return False
+        nxt["v"] = (elapsed // period + 1) * period
+        return True
+
+    def _reminder_tick(_total_seconds: int):
+        if not ctrl.is_running() or ctrl.get_phase() != Phase.WORK:
             return
 
-        work_total = ctrl.get_routine()[0]
-        elapsed = max(work_total - ctrl.get_remaining_sec(), 0)
+        elapsed = max(ctrl.get_routine()[0] - ctrl.get_remaining_sec(), 0)
 
-        if FOCUS_EYE_REMINDER_SEC > 0:
-            eye_period = elapsed // FOCUS_EYE_REMINDER_SEC
-            if eye_period > 0 and eye_period != last_eye["v"]:
-                last_eye["v"] = eye_period
-                reminder_var.set(FOCUS_EYE_REMINDER_MESSAGE)
-                show_toast(parent.winfo_toplevel(), FOCUS_EYE_REMINDER_MESSAGE, 2500)
+        if FOCUS_EYE_REMINDER_SEC > 0 and _due(next_eye, FOCUS_EYE_REMINDER_SEC, elapsed):
+            reminder_var.set(FOCUS_EYE_REMINDER_MESSAGE)
+            show_toast(parent.winfo_toplevel(), FOCUS_EYE_REMINDER_MESSAGE, 2500)
 
-        if FOCUS_HYDRATION_REMINDER_SEC > 0:
-            hyd_period = elapsed // FOCUS_HYDRATION_REMINDER_SEC
-            if hyd_period > 0 and hyd_period != last_hyd["v"]:
-                last_hyd["v"] = hyd_period
-                reminder_var.set(FOCUS_HYDRATION_REMINDER_MESSAGE)
-                show_toast(parent.winfo_toplevel(), FOCUS_HYDRATION_REMINDER_MESSAGE, 2500)
+        if FOCUS_HYDRATION_REMINDER_SEC > 0 and _due(next_hyd, FOCUS_HYDRATION_REMINDER_SEC, elapsed):
+            reminder_var.set(FOCUS_HYDRATION_REMINDER_MESSAGE)
+            show_toast(parent.winfo_toplevel(), FOCUS_HYDRATION_REMINDER_MESSAGE, 2500)
 
     add_tick_listener(ctrl.on_tick)
-    add_tick_listener(_on_tick)
+    add_tick_listener(_clock_tick)
+    add_tick_listener(_reminder_tick)
 
     # Initial state
     on_update_ui()
-    _on_tick(0)
+    _clock_tick(0)
     refresh_day_tasks()
@@ -20,15 +20,11 @@ from core.loop import AppLoop
 from features.focus.view import build as build_focus
 from ui.tabs import open_settings_window
 from core.settings import load_settings
+from core import db
 from ui.wizard import run_first_time_wizard
 from features.hydration import controller as hc
 
 
-def _climate_from_temperature(t: float) -> str:
-    """Map temperature (°C) to climate category."""
-    return "cool" if t <= 10 else ("hot" if t >= 25 else "temperate")
-
-
 def main() -> None:
     """Main entry point for the FocusWell application."""
     window = create_app_window("FocusWell - Wellness Assistant")
@@ -48,7 +44,7 @@ def main() -> None:
         sys.exit(0)
 
     # Apply hydration profile and reset daily intake
-    climate = _climate_from_temperature(settings.temperature_c or 20.0)
+    climate = hc.climate_from_temperature(settings.temperature_c or 20.0)
     hc.set_profile(
         sex=settings.sex,
         weight_kg=settings.weight_kg,
@@ -77,6 +73,7 @@ def main() -> None:
     )
 
     window.mainloop()
+    db.close_db()
 
 
 if __name__ == "__main__":
@@ -2,12 +2,13 @@
 import sqlite3
 import pytest
 import core.db as db
+from features.planner import controller as pc
 
 # --- Keep a master shared in-memory DB alive for the whole session ---
 @pytest.fixture(scope="session", autouse=True)
 def shared_memory_master():
     uri = "file:focuswell_test?mode=memory&cache=shared"
-    master = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    master = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None)
     master.execute("PRAGMA foreign_keys = ON")
     yield {"uri": uri, "master": master}
     try:
@@ -15,29 +16,31 @@ def shared_memory_master():
     except Exception:
         pass
 
-# --- For each test: patch get_connection() to open NEW conns to the same DB,
-#     ensure schema, and start from a clean tasks table. ---
-@pytest.fixture(autouse=True)
-def patch_db_and_clean(monkeypatch, shared_memory_master):
-    uri = shared_memory_master["uri"]
+# --- Once per session: hand the master handle to core.db as its shared
+#     connection (no extra handles, PRAGMAs run once) and create the schema. ---
+@pytest.fixture(scope="session", autouse=True)
+def patch_db(shared_memory_master):
+    master = shared_memory_master["master"]
 
     def _new_connection():
-        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        return master
 
-    # All core.db calls will use a fresh connection to the shared in-memory DB
-    monkeypatch.setattr(db, "get_connection", _new_connection, raising=True)
-
-    # Ensure schema exists (idempotent)
+    mp = pytest.MonkeyPatch()
+    db.close_db()
+    mp.setattr(db, "get_connection", _new_connection, raising=True)
     db.init_db()
+    yield
+    db.close_db()
+    mp.undo()
 
-    # Clean table so tests don't affect each other
-    conn = _new_connection()
-    try:
-        conn.execute("DELETE FROM tasks")
-        conn.commit()
-    finally:
-        conn.close()
-
+# --- For each test: run inside a savepoint on the shared connection and
+#     roll it back afterwards, so every test starts from a pristine DB. ---
+@pytest.fixture(autouse=True)
+def clean_db(patch_db):
+    conn = db._get_conn()
+    conn.execute("SAVEPOINT test")
+    pc.clear_cache()
     yield
+    conn.execute("ROLLBACK TO test")
+    conn.execute("RELEASE test")
+    pc.clear_cache()
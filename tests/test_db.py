@@ -0,0 +1,66 @@
+# tests/test_db.py
+import pytest
+import core.db as db
+
+def test_execute_many_inserts_in_one_batch():
+    db.execute_many("INSERT INTO tasks (title) VALUES (?)", [("A",), ("B",), ("C",)])
+    rows = db.query_all("SELECT title FROM tasks ORDER BY id")
+    assert [r[0] for r in rows] == ["A", "B", "C"]
+
+def test_transaction_rolls_back_on_error():
+    with pytest.raises(RuntimeError):
+        with db.transaction() as c:
+            c.execute("INSERT INTO tasks (title) VALUES (?)", ("X",))
+            raise RuntimeError("boom")
+    assert db.query_all("SELECT COUNT(*) FROM tasks")[0][0] == 0
+
+    with db.transaction() as c:
+        c.execute("INSERT INTO tasks (title) VALUES (?)", ("Y",))
+        c.execute("INSERT INTO tasks (title) VALUES (?)", ("Z",))
+    assert db.query_all("SELECT COUNT(*) FROM tasks")[0][0] == 2
+
+def test_execute_joins_open_transaction():
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.execute("INSERT INTO tasks (title) VALUES (?)", ("W",))
+            raise RuntimeError("boom")
+    assert db.query_all("SELECT COUNT(*) FROM tasks")[0][0] == 0
+
+def test_migration_turns_empty_dates_into_null():
+    db.execute("INSERT INTO tasks (title, due_date, due_time) VALUES (?, ?, ?)", ("Old", "", ""))
+    db.execute("PRAGMA user_version = 1")
+    db.init_db()
+    assert db.query_all("SELECT due_date, due_time FROM tasks") == [(None, None)]
+    assert db.query_all("PRAGMA user_version")[0][0] == db._SCHEMA_VERSION
+
+def test_helpers_reuse_one_connection(monkeypatch):
+    conn = db._get_conn()
+    opened = []
+    monkeypatch.setattr(db, "get_connection", lambda: opened.append(1))
+    for i in range(5):
+        db.execute("INSERT INTO tasks (title) VALUES (?)", (f"T{i}",))
+        db.query_all("SELECT COUNT(*) FROM tasks")
+    assert opened == [] and db._get_conn() is conn
+
+def test_transaction_keeps_original_error_after_sqlite_rollback(monkeypatch):
+    import sqlite3
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE t (x)")
+    monkeypatch.setattr(db, "_get_conn", lambda: conn)
+
+    # SQLite ends the transaction itself on e.g. SQLITE_FULL; simulate that
+    with pytest.raises(RuntimeError, match="disk full"):
+        with db.transaction() as c:
+            c.execute("INSERT INTO t VALUES (1)")
+            c.execute("ROLLBACK")
+            raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        with db.transaction():
+            with db.transaction() as c:
+                c.execute("INSERT INTO t VALUES (2)")
+                c.execute("ROLLBACK")
+                raise RuntimeError("disk full")
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    conn.close()
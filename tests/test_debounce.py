@@ -0,0 +1,33 @@
+# tests/test_debounce.py
+from types import SimpleNamespace
+from ui.debounce import debounced
+
+class _FakeWidget:
+    def __init__(self):
+        self.jobs, self.handlers = {}, []
+    def after(self, ms, fn):
+        job = f"after#{len(self.jobs)}-{ms}-{id(fn)}"
+        self.jobs[job] = fn
+        return job
+    def after_cancel(self, job): self.jobs.pop(job, None)
+    def bind(self, seq, fn, add=None): self.handlers.append(fn)
+    def destroy(self):
+        for fn in self.handlers:
+            fn(SimpleNamespace(widget=self))
+
+def test_burst_runs_once():
+    w, calls = _FakeWidget(), []
+    trigger = debounced(w, 120, lambda: calls.append(1))
+    for _ in range(5):
+        trigger()
+    assert len(w.jobs) == 1
+    for fn in list(w.jobs.values()):
+        fn()
+    assert calls == [1]
+
+def test_destroy_cancels_pending_run():
+    w, calls = _FakeWidget(), []
+    trigger = debounced(w, 120, lambda: calls.append(1))
+    trigger()
+    w.destroy()
+    assert w.jobs == {} and calls == []
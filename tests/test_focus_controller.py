@@ -1,11 +1,13 @@
 # tests/test_focus_controller.py
-from features.focus.controller import FocusController
+import dataclasses
+import pytest
+from features.focus.controller import FocusController, Phase
 
 def test_focus_timer_cycle():
     ctrl = FocusController()
     ctrl.set_routine(3, 2)  # 3s work, 2s break
 
-    assert ctrl.get_phase() == "WORK"
+    assert ctrl.get_phase() == Phase.WORK
     assert ctrl.get_remaining_sec() == 3
     assert not ctrl.is_running()
 
@@ -15,18 +17,40 @@ def test_focus_timer_cycle():
     # Simulate 3 seconds → end of WORK → switch to BREAK
     for i in range(3):
         ctrl.on_tick(i + 1)
-    assert ctrl.get_phase() == "BREAK"
+    assert ctrl.get_phase() == Phase.BREAK
     assert ctrl.get_remaining_sec() == 2
 
     # Simulate 2 seconds → end of BREAK → back to WORK
     for i in range(2):
         ctrl.on_tick(10 + i)
-    assert ctrl.get_phase() == "WORK"
+    assert ctrl.get_phase() == Phase.WORK
     assert ctrl.get_remaining_sec() == 3
 
     ctrl.pause()
     assert not ctrl.is_running()
 
     ctrl.reset()
-    assert ctrl.get_phase() == "IDLE"
+    assert ctrl.get_phase() == Phase.IDLE
     assert ctrl.get_remaining_sec() == 0
+
+def test_phase_switch_emits_single_update():
+    ctrl = FocusController()
+    ctrl.set_routine(2, 1)
+    ctrl.start()
+
+    updates, phases = [], []
+    ctrl.set_on_update(lambda: updates.append(ctrl.get_remaining_sec()))
+    ctrl.set_on_phase_change(phases.append)
+
+    ctrl.on_tick(1)
+    ctrl.on_tick(2)  # WORK ends → BREAK
+    assert phases == [Phase.BREAK]
+    assert updates == [1, 1]  # no intermediate "00:00" update
+
+def test_snapshot_is_read_only_view():
+    ctrl = FocusController()
+    ctrl.set_routine(4, 2)
+    snap = ctrl.snapshot()
+    assert (snap.phase, snap.running, snap.remaining_sec, snap.routine) == (Phase.WORK, False, 4, (4, 2))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.remaining_sec = 0
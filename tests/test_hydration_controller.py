@@ -25,3 +25,57 @@ def test_hydration_goal_clamped_limits():
     # Too high: should clamp to at most 6000 ml
     hc.set_profile(sex="male", weight_kg=200, climate="hot", activity="high")
     assert hc.get_goal_ml() <= 6000
+
+def test_hydration_listeners_skip_unchanged_state():
+    hc.reset_today()
+    calls = []
+    listener = lambda: calls.append(hc.get_version())
+    hc.add_change_listener(listener)
+    try:
+        hc.reset_today()                      # already 0 ml -> no notify
+        assert calls == []
+        hc.add_glass()
+        assert calls == [hc.get_version()]
+        while hc.get_total_ml() < 10_000:
+            hc.add_glass()
+        n = len(calls)
+        hc.add_glass()                        # capped -> nothing changed
+        assert len(calls) == n
+    finally:
+        hc.remove_change_listener(listener)
+        hc.reset_today()
+
+def test_hydration_snapshot_matches_getters():
+    hc.reset_today()
+    hc.add_glass()
+    assert hc.get_snapshot() == (hc.get_total_glasses(), hc.get_goal_glasses(), hc.get_progress_ratio())
+    hc.reset_today()
+
+def test_climate_from_temperature_thresholds():
+    assert hc.climate_from_temperature(10) == "cool"
+    assert hc.climate_from_temperature(10.5) == "temperate"
+    assert hc.climate_from_temperature(24.9) == "temperate"
+    assert hc.climate_from_temperature(25) == "hot"
+
+def test_integer_goal_matches_float_formula_except_exact_halves():
+    # float formula the integer math replaced
+    def float_goal(p):
+        base = p.weight_kg * 35.0 if p.weight_kg else (
+            hc._MALE_BASE_ML if p.sex == "male" else hc._FEMALE_BASE_ML)
+        goal = int(round(base * hc._CLIMATE_FACTORS[p.climate] * hc._ACTIVITY_FACTORS[p.activity]))
+        return max(1200, min(goal, 6000))
+
+    drift = []
+    for tenths in range(300, 2000):
+        for c in hc._CLIMATE_FACTORS:
+            for a in hc._ACTIVITY_FACTORS:
+                p = hc.HydrationProfile(sex="male", weight_kg=tenths / 10, climate=c, activity=a)
+                got, want = hc._compute_goal_ml(p), float_goal(p)
+                if got != want:
+                    # only exact .5 ml ties, where float noise picked the other side
+                    assert abs(got - want) == 1
+                    assert (tenths * 35 * hc._COMBINED_PERMILLE[(c, a)]) % 10000 == 5000
+                    drift.append((tenths / 10, c, a))
+    assert len(drift) == 6
+    # e.g. 38 kg × 1.15 = 1529.5 ml exactly → even (1530); float gave 1529
+    assert hc._compute_goal_ml(hc.HydrationProfile(weight_kg=38.0, activity="high")) == 1530
@@ -0,0 +1,72 @@
+# tests/test_loop.py
+import core.loop as loop_mod
+import ui.toasts
+from core.loop import AppLoop
+
+
+class FakeRoot:
+    """Minimal stand-in for tk.Tk: records `after` jobs and runs them on demand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._next = 0
+
+    def after(self, ms, cb, *args):
+        self._next += 1
+        job = f"after#{self._next}"
+        self.jobs[job] = (ms, lambda: cb(*args))
+        return job
+
+    def after_idle(self, cb, *args):
+        return self.after("idle", cb, *args)
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_pending(self):
+        pending, self.jobs = self.jobs, {}
+        for _ms, cb in pending.values():
+            cb()
+
+
+def test_tick_runs_only_while_listeners_exist():
+    root = FakeRoot()
+    app = AppLoop(root, interval_ms=1000)
+    app.start()
+    assert root.jobs == {}  # nudges are disabled in core.config by default
+
+    calls = []
+    cb = calls.append
+    app.add_tick_listener(cb)
+    assert any(ms == 1000 for ms, _ in root.jobs.values())
+
+    root.run_pending()  # tick → next tick + idle batch
+    root.run_pending()  # idle batch runs listeners, second tick fires
+    root.run_pending()
+    assert len(calls) == 2
+
+    app.remove_tick_listener(cb)
+    assert all(ms != 1000 for ms, _ in root.jobs.values())
+    app.stop()
+    root.run_pending()
+    assert root.jobs == {} and len(calls) == 2
+
+
+def test_nudges_are_scheduled_with_after(monkeypatch):
+    shown = []
+    monkeypatch.setattr(loop_mod, "ENABLE_EYE_CARE", True)
+    monkeypatch.setattr(loop_mod, "EYE_BREAK_INTERVAL_SEC", 5)
+    monkeypatch.setattr(ui.toasts, "show_toast", lambda root, msg, ms: shown.append(msg))
+
+    root = FakeRoot()
+    app = AppLoop(root)
+    app.start()
+    (delay_ms,) = [ms for ms, _ in root.jobs.values()]
+    assert 4900 <= delay_ms <= 5000
+
+    root.run_pending()
+    assert shown == [loop_mod.EYE_BREAK_MESSAGE]
+    assert len(root.jobs) == 1  # re-scheduled itself
+
+    app.stop()
+    assert root.jobs == {}
@@ -43,3 +43,73 @@ def test_toggle_update_delete_and_upcoming():
     pc.delete_task(id_a)
     day_items = pc.list_tasks_by_date(d0)
     assert all(t.id != id_a for t in day_items)
+
+def test_add_tasks_bulk_single_batch():
+    pc.init_storage()
+
+    n = pc.add_tasks_bulk([
+        ("Bulk A", "2025-10-20", "09:00"),
+        ("  ", "2025-10-20", None),       # blank title skipped
+        ("Bulk B", "2025-10-20", None),
+        ("Bulk C", None, "07:00"),         # time without date dropped
+    ])
+    assert n == 3
+    assert [t.title for t in pc.list_tasks_by_date("2025-10-20")] == ["Bulk A", "Bulk B"]
+    loose = [t for t in pc.list_tasks() if t.title == "Bulk C"]
+    assert loose and loose[0].due_date is None and loose[0].due_time is None
+
+def test_list_queries_use_index_order():
+    pc.init_storage()
+
+    for sql, params in (
+        (pc._SQL_LIST_BY_DATE, ("2025-10-16",)),
+        (pc._SQL_LIST_AFTER_DATE, ("2025-10-16", 50)),
+        (pc._SQL_LIST_OPEN, ()),
+    ):
+        plan = " ".join(str(r[-1]) for r in pc.db.query_all("EXPLAIN QUERY PLAN " + sql, params))
+        assert "TEMP B-TREE" not in plan, plan
+
+def test_list_by_date_cache_invalidated_on_writes():
+    pc.init_storage()
+
+    d = "2025-11-01"
+    tid = pc.add_task("Cached", due_date=d, due_time="10:00")
+    assert [t.title for t in pc.list_tasks_by_date(d)] == ["Cached"]
+    assert d in pc._by_date_cache
+
+    pc.add_task("Second", due_date=d, due_time="09:00")
+    assert [t.title for t in pc.list_tasks_by_date(d)] == ["Second", "Cached"]
+
+    pc.toggle_done(tid, True)
+    assert [t.done for t in pc.list_tasks_by_date(d)] == [False, True]
+
+    pc.delete_task(tid)
+    assert [t.title for t in pc.list_tasks_by_date(d)] == ["Second"]
+
+def test_upcoming_query_is_an_index_range_scan():
+    pc.init_storage()
+
+    plan = [str(r[-1]) for r in pc.db.query_all("EXPLAIN QUERY PLAN " + pc._SQL_LIST_AFTER_DATE, ("2025-10-16", 50))]
+    assert plan == ["SEARCH tasks USING INDEX idx_tasks_due (due_date>?)"]
+
+def test_add_tasks_bulk_accepts_generator():
+    pc.init_storage()
+
+    n = pc.add_tasks_bulk((f"Gen {i}", "2025-12-01", f"{i:02d}:00") for i in range(10))
+    assert n == 10
+    assert len(pc.list_tasks_by_date("2025-12-01")) == 10
+
+def test_list_by_date_cache_evicts_least_recently_used():
+    pc.init_storage()
+
+    a = "2025-01-01"
+    pc.list_tasks_by_date(a)
+    others = [f"2025-02-{i:02d}" for i in range(1, pc._BY_DATE_CACHE_SIZE)]
+    for d in others:                       # cache now full, `a` is the oldest
+        pc.list_tasks_by_date(d)
+    pc.list_tasks_by_date(a)               # hit → most recently used
+    pc.list_tasks_by_date("2025-03-01")    # one more date forces an eviction
+
+    assert a in pc._by_date_cache
+    assert others[0] not in pc._by_date_cache
+    assert len(pc._by_date_cache) == pc._BY_DATE_CACHE_SIZE
@@ -0,0 +1,81 @@
+# tests/test_settings.py
+import json
+import os
+import core.settings as st
+from core.settings import AppSettings
+
+def test_load_settings_cached_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(st, "_SETTINGS_PATH", str(path))
+    monkeypatch.setattr(st, "_SETTINGS_TMP_PATH", str(path) + ".tmp")
+    monkeypatch.setattr(st, "_SETTINGS_DIR", tmp_path)
+    monkeypatch.setattr(st, "_cache", None)
+
+    assert st.load_settings() == AppSettings()  # missing file → defaults
+
+    st.save_settings(AppSettings(sex="male", weight_kg=70.0, temperature_c=20.0))
+    first = st.load_settings()
+    assert first.weight_kg == 70.0
+    assert st.load_settings() is first  # served from cache
+
+    # External edit with a new mtime → reparsed
+    path.write_text(json.dumps({"sex": "female", "weight_kg": 55.0}), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert st.load_settings().weight_kg == 55.0
+
+def test_is_complete_and_numeric_fields_checked_on_load(tmp_path, monkeypatch):
+    assert not AppSettings().is_complete()
+    assert AppSettings(weight_kg=60, temperature_c=0).is_complete()
+    assert not AppSettings(weight_kg=0, temperature_c=20.0).is_complete()
+
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(st, "_SETTINGS_PATH", str(path))
+    monkeypatch.setattr(st, "_cache", None)
+    path.write_text(json.dumps({"weight_kg": "70", "temperature_c": 21}), encoding="utf-8")
+    loaded = st.load_settings()
+    assert loaded.weight_kg is None and loaded.temperature_c == 21
+    assert not loaded.is_complete()
+
+def test_parse_float_accepts_comma_and_rejects_partial_input():
+    assert st.parse_float("72,5") == 72.5
+    assert st.parse_float(" 70 ") == 70.0
+    assert st.parse_float("-3") == -3.0
+    assert st.parse_float(".5") == 0.5
+    for bad in (None, "", "-", "7a", "1.2.3", "abc"):
+        assert st.parse_float(bad) is None
+
+def test_cached_settings_cannot_be_mutated_in_place(tmp_path, monkeypatch):
+    import dataclasses
+    import pytest
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(st, "_SETTINGS_PATH", str(path))
+    monkeypatch.setattr(st, "_SETTINGS_TMP_PATH", str(path) + ".tmp")
+    monkeypatch.setattr(st, "_SETTINGS_DIR", tmp_path)
+    monkeypatch.setattr(st, "_cache", None)
+
+    st.save_settings(AppSettings(weight_kg=70.0, temperature_c=20.0, timezone="Europe/Athens"))
+    loaded = st.load_settings()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        loaded.timezone = "UTC"
+    edited = dataclasses.replace(loaded, timezone="UTC")
+    assert edited.timezone == "UTC"
+    assert st.load_settings().timezone == "Europe/Athens"
+
+def test_failed_save_removes_temp_file_and_keeps_old_settings(tmp_path, monkeypatch):
+    import pytest
+    path = tmp_path / "settings.json"
+    tmp = str(path) + ".tmp"
+    monkeypatch.setattr(st, "_SETTINGS_PATH", str(path))
+    monkeypatch.setattr(st, "_SETTINGS_TMP_PATH", tmp)
+    monkeypatch.setattr(st, "_SETTINGS_DIR", tmp_path)
+    monkeypatch.setattr(st, "_cache", None)
+    st.save_settings(AppSettings(weight_kg=70.0, temperature_c=20.0))
+
+    def _boom(data):
+        raise TypeError("not serialisable")
+    monkeypatch.setattr(st, "_dumps", _boom)
+    with pytest.raises(TypeError):
+        st.save_settings(AppSettings(weight_kg=80.0, temperature_c=20.0))
+    assert not os.path.exists(tmp)
+    assert st.load_settings().weight_kg == 70.0
@@ -0,0 +1,32 @@
+# tests/test_tabs.py
+from datetime import date, timedelta
+import ui.tabs as tabs
+
+def _loop_last_sunday(year, month):
+    d = (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)) - timedelta(days=1)
+    while d.weekday() != 6:
+        d -= timedelta(days=1)
+    return d
+
+def test_dst_boundaries_closed_form():
+    for year in range(2000, 2040):
+        for month in range(1, 13):
+            assert tabs._last_sunday(year, month) == _loop_last_sunday(year, month)
+    # 2025: EU 30 Mar → 26 Oct, US 9 Mar → 2 Nov
+    assert tabs._eu_is_dst(date(2025, 3, 30)) and not tabs._eu_is_dst(date(2025, 3, 29))
+    assert tabs._eu_is_dst(date(2025, 10, 25)) and not tabs._eu_is_dst(date(2025, 10, 26))
+    assert tabs._us_is_dst(date(2025, 3, 9)) and not tabs._us_is_dst(date(2025, 3, 8))
+    assert tabs._us_is_dst(date(2025, 11, 1)) and not tabs._us_is_dst(date(2025, 11, 2))
+
+def test_city_offset_strings():
+    assert tabs._city_to_current_offset_str("Europe/Athens", date(2025, 7, 1)) == "+03:00"
+    assert tabs._city_to_current_offset_str("Europe/Athens", date(2025, 1, 1)) == "+02:00"
+    assert tabs._city_to_current_offset_str("America/New_York", date(2025, 1, 1)) == "-05:00"
+    assert tabs._city_to_current_offset_str("Asia/Kolkata", date(2025, 1, 1)) == "+05:30"
+
+def test_city_display_uses_given_instant():
+    from datetime import datetime, timezone
+    winter = datetime(2025, 1, 15, 12, tzinfo=timezone.utc)
+    assert tabs._format_city_display("Europe/Athens", "Athens", winter).endswith("GMT+02:00")
+    assert tabs._format_city_display("Asia/Kolkata", "Delhi", winter).endswith("GMT+05:30")
+    assert tabs._format_city_display("America/New_York", "NYC", winter).endswith("GMT-05:00")
@@ -0,0 +1,43 @@
+# tests/test_toasts.py
+import ui.toasts as toasts
+
+_jobs = {}  # pending after() callbacks, shared like a Tcl interpreter's queue
+
+class _FakeWidget:
+    def __init__(self, master=None, **kw):
+        self.master, self.alive, self.withdrawn = master, True, True
+    def winfo_exists(self): return self.alive
+    def destroy(self): self.alive = False
+    def withdraw(self): self.withdrawn = True
+    def deiconify(self): self.withdrawn = False
+    def after(self, ms, fn):
+        job = f"after#{len(_jobs)}-{id(fn)}-{ms}-{id(self)}"
+        _jobs[job] = fn
+        return job
+    def after_cancel(self, job): _jobs.pop(job, None)
+    def __getattr__(self, name):  # overrideredirect, attributes, geometry, lift, pack, configure...
+        return lambda *a, **k: None
+
+class _FakeRoot(_FakeWidget):
+    def winfo_rootx(self): return 0
+    def winfo_rooty(self): return 0
+    def winfo_width(self): return 800
+    def winfo_height(self): return 600
+
+def test_new_root_retires_previous_toast(monkeypatch):
+    monkeypatch.setattr(toasts.tk, "Toplevel", _FakeWidget)
+    monkeypatch.setattr(toasts.tk, "Label", _FakeWidget)
+    for key in ("root", "win", "label", "after"):
+        monkeypatch.setitem(toasts._toast_singleton, key, None)
+    _jobs.clear()
+
+    toasts.show_toast(_FakeRoot(), "first", 1000)
+    old = toasts._toast_singleton["win"]
+    toasts.show_toast(_FakeRoot(), "second", 1000)
+    new = toasts._toast_singleton["win"]
+
+    assert new is not old and not old.alive
+    assert list(_jobs) == [toasts._toast_singleton["after"]]  # old hide job cancelled
+    for fn in list(_jobs.values()):
+        fn()
+    assert new.withdrawn and toasts._toast_singleton["after"] is None
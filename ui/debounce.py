@@ -0,0 +1,45 @@
+"""
+ui/debounce.py
+---------------
+Coalesce bursts of UI events (keystrokes, combobox picks, refresh requests)
+into a single Tk `after` callback.
+
+Usage:
+    from ui.debounce import debounced
+    reload_soon = debounced(listbox, 120, reload)
+    search_var.trace_add("write", lambda *_: reload_soon())
+
+The pending job is cancelled when `widget` is destroyed, so a burst that ends
+just before its window closes never runs against dead widgets.
+"""
+
+import tkinter as tk
+from typing import Callable
+
+
+def debounced(widget: tk.Misc, ms: int, fn: Callable[[], None]) -> Callable[..., None]:
+    """Return a trigger that runs `fn` once, `ms` after the last call in a burst."""
+    pending = {"id": None}
+
+    def _run():
+        pending["id"] = None
+        fn()
+
+    def _cancel():
+        if pending["id"] is not None:
+            try:
+                widget.after_cancel(pending["id"])
+            except tk.TclError:
+                pass
+            pending["id"] = None
+
+    def trigger(*_):
+        _cancel()
+        pending["id"] = widget.after(ms, _run)
+
+    def _on_destroy(e):
+        if e.widget is widget:
+            _cancel()
+
+    widget.bind("<Destroy>", _on_destroy, add="+")
+    return trigger
@@ -14,12 +14,17 @@ and resets the daily intake to match the new profile.
 
 from __future__ import annotations
 
+import calendar
+import time
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta, timezone, date
-from typing import List, Tuple, Dict, Optional
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Mapping, Optional
 
-from core.settings import load_settings, save_settings, AppSettings
+from core.settings import load_settings, save_settings, parse_float, AppSettings
+from ui.debounce import debounced
 from features.hydration import controller as hc
 
 # Try IANA time zones (requires tzdata on Windows)
@@ -28,11 +33,21 @@ try:
 except Exception:  # pragma: no cover
     ZoneInfo = None  # type: ignore
 
+@lru_cache(maxsize=None)
+def _zi(tz: str):
+    """ZoneInfo(tz), built once per name; None when tzdata/zone is unavailable."""
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(tz)
+    except Exception:
+        return None
+
 # -----------------------------
 # Curated city list (IANA tz)
 # -----------------------------
 # Format: (IANA tz, "City, Country")
-CITIES: List[Tuple[str, str]] = [
+CITIES: Tuple[Tuple[str, str], ...] = (
     # Europe
     ("Europe/Athens",       "Athens, Greece"),
     ("Europe/London",       "London, United Kingdom"),
@@ -80,13 +95,13 @@ CITIES: List[Tuple[str, str]] = [
     ("Australia/Sydney",    "Sydney, Australia"),
     ("Australia/Melbourne", "Melbourne, Australia"),
     ("Pacific/Auckland",    "Auckland, New Zealand"),
-]
+)
 
 # -----------------------------
 # Fallback rules (no tzdata)
 # -----------------------------
 # rule: "EU" (DST), "US" (DST), "NONE" (fixed or simplified)
-CITY_RULES: Dict[str, Tuple[str, float]] = {
+CITY_RULES: Mapping[str, Tuple[str, float]] = MappingProxyType({
     # Europe (EU DST)
     "Europe/Athens":      ("EU",  2),
     "Europe/Paris":       ("EU",  1),
@@ -132,63 +147,97 @@ CITY_RULES: Dict[str, Tuple[str, float]] = {
     "Australia/Sydney":    ("NONE", 10),  # simplified
     "Australia/Melbourne": ("NONE", 10),
     "Pacific/Auckland":    ("NONE", 12),
-}
+})
+
+# Same rules with the base offset in whole minutes (integer-only formatting)
+CITY_RULES_MIN: Mapping[str, Tuple[str, int]] = MappingProxyType({
+    tz: (rule, int(round(hours * 60))) for tz, (rule, hours) in CITY_RULES.items()
+})
 
 # -----------------------------
 # DST helpers (fallback)
 # -----------------------------
 def _last_sunday(year: int, month: int) -> date:
-    if month == 12:
-        d = date(year + 1, 1, 1)
-    else:
-        d = date(year, month + 1, 1)
-    d -= timedelta(days=1)
-    while d.weekday() != 6:
-        d -= timedelta(days=1)
-    return d
+    ld = calendar.monthrange(year, month)[1]
+    return date(year, month, ld - ((date(year, month, ld).weekday() - 6) % 7))
+
+def _first_sunday_day(year: int, month: int) -> int:
+    """Day of month of the first Sunday (weekday 6)."""
+    return 1 + (6 - date(year, month, 1).weekday()) % 7
+
+# year → (eu_start, eu_end, us_start, us_end), filled on first use per year
+_dst_bounds: Dict[int, Tuple[date, date, date, date]] = {}
+
+def _bounds(year: int) -> Tuple[date, date, date, date]:
+    b = _dst_bounds.get(year)
+    if b is None:
+        b = _dst_bounds[year] = (
+            _last_sunday(year, 3),                                # EU: last Sunday of March
+            _last_sunday(year, 10),                               # EU: last Sunday of October
+            date(year, 3, _first_sunday_day(year, 3) + 7),        # US: 2nd Sunday in March
+            date(year, 11, _first_sunday_day(year, 11)),          # US: 1st Sunday in November
+        )
+    return b
 
 def _eu_is_dst(d: date) -> bool:
-    start = _last_sunday(d.year, 3)   # last Sunday of March
-    end   = _last_sunday(d.year, 10)  # last Sunday of October
+    start, end, _, _ = _bounds(d.year)
     return start <= d < end
 
 def _us_is_dst(d: date) -> bool:
-    # 2nd Sunday in March
-    d1 = date(d.year, 3, 1)
-    while d1.weekday() != 6: d1 += timedelta(days=1)
-    second_sun_march = d1 + timedelta(days=7)
-    # 1st Sunday in November
-    d2 = date(d.year, 11, 1)
-    while d2.weekday() != 6: d2 += timedelta(days=1)
-    first_sun_nov = d2
-    return second_sun_march <= d < first_sun_nov
+    _, _, start, end = _bounds(d.year)
+    return start <= d < end
 
-def _city_to_current_offset_str(tz_name: str, today: Optional[date] = None) -> str:
+@lru_cache(maxsize=256)
+def _offset_cached(tz_name: str, ord_day: int) -> str:
     if tz_name == "UTC":
         return "+00:00"
-    rule, base = CITY_RULES.get(tz_name, ("NONE", 0))
-    today = today or date.today()
-    hours = base
-    if rule == "EU" and _eu_is_dst(today):
-        hours = base + 1
-    elif rule == "US" and _us_is_dst(today):
-        hours = base + 1
-    sign = "+" if hours >= 0 else "-"
-    ah = abs(hours); hh = int(ah); mm = int(round((ah - hh) * 60))
-    return f"{sign}{hh:02d}:{mm:02d}"
-
-def _format_city_display(tz: str, label: str) -> str:
-    gmt = ""
-    if ZoneInfo is not None:
-        try:
-            off = datetime.now(ZoneInfo(tz)).utcoffset() or timedelta(0)
-            sign = "+" if off >= timedelta(0) else "-"
-            off = abs(off); hh = off.seconds // 3600; mm = (off.seconds // 60) % 60
-            gmt = f" — GMT{sign}{hh:02d}:{mm:02d}"
-        except Exception:
-            pass
-    return f"{label} ({tz}){gmt}"
+    rule, minutes = CITY_RULES_MIN.get(tz_name, ("NONE", 0))
+    today = date.fromordinal(ord_day)
+    if (rule == "EU" and _eu_is_dst(today)) or (rule == "US" and _us_is_dst(today)):
+        minutes += 60
+    return _fmt_offset_min(minutes)
+
+def _fmt_offset_min(minutes: int) -> str:
+    sign = "+" if minutes >= 0 else "-"
+    am = abs(minutes)
+    return f"{sign}{am // 60:02d}:{am % 60:02d}"
 
+def _city_to_current_offset_str(tz_name: str, today: Optional[date] = None) -> str:
+    """Fallback '+HH:MM' for a city; only changes per day, so memoized by (tz, day)."""
+    return _offset_cached(tz_name, (today or date.today()).toordinal())
+
+def _format_city_display(tz: str, label: str, now_utc: Optional[datetime] = None) -> str:
+    """'Label (tz) — GMT±HH:MM'; tzdata offset at `now_utc`, else the fallback rules."""
+    zi = _zi(tz)
+    if zi is not None:
+        off = (now_utc or datetime.now(timezone.utc)).astimezone(zi).utcoffset() or timedelta(0)
+        gmt = _fmt_offset_min(int(off.total_seconds()) // 60)
+    else:
+        gmt = _city_to_current_offset_str(tz)
+    return f"{label} ({tz}) — GMT{gmt}"
+
+# (tz, label, label_lower, tz_lower, display) per city. The GMT offset in
+# `display` only moves at DST changes, so the list is rebuilt every few minutes
+# rather than on each search keystroke.
+_CITY_DISPLAY_TTL_SEC = 300.0
+_CITY_DISPLAY_CACHE: Dict[str, object] = {"stamp": 0.0, "items": []}
+
+def _build_display() -> None:
+    now_utc = datetime.now(timezone.utc)  # one clock read per rebuild
+    _CITY_DISPLAY_CACHE["items"] = [
+        (tz, label, label.lower(), tz.lower(), _format_city_display(tz, label, now_utc))
+        for tz, label in CITIES
+    ]
+    _CITY_DISPLAY_CACHE["stamp"] = time.monotonic()
+
+def _city_display_items() -> List[Tuple[str, str, str, str, str]]:
+    if not _CITY_DISPLAY_CACHE["items"] or time.monotonic() - _CITY_DISPLAY_CACHE["stamp"] > _CITY_DISPLAY_TTL_SEC:
+        _build_display()
+    return _CITY_DISPLAY_CACHE["items"]  # type: ignore[return-value]
+
+_build_display()
+
+@lru_cache(maxsize=64)
 def _tzinfo_from_offset_str(s: str) -> timezone:
     sign = 1 if s.startswith("+") else -1
     hh = int(s[1:3]); mm = int(s[4:6])
@@ -203,9 +252,12 @@ def open_settings_window(root: tk.Tk) -> dict:
     win.geometry("680x600")
     win.minsize(660, 560)
 
+    # Buttons live under the notebook so Apply works from either tab
+    btns = ttk.Frame(win, padding=(16, 0, 16, 16)); btns.pack(side="bottom", fill="x")
     notebook = ttk.Notebook(win); notebook.pack(fill="both", expand=True)
 
     settings_tab = ttk.Frame(notebook); notebook.add(settings_tab, text="Settings")
+    tz_tab = ttk.Frame(notebook); notebook.add(tz_tab, text="Time Zone")
     wrapper = ttk.Frame(settings_tab, padding=16); wrapper.pack(fill="both", expand=True)
 
     ttk.Label(wrapper, text="App Settings ⚙️", font=("Segoe UI", 14, "bold")).pack(anchor="w", pady=(0, 12))
@@ -234,97 +286,100 @@ def open_settings_window(root: tk.Tk) -> dict:
     ttk.Combobox(form, textvariable=activity_var, values=["low", "moderate", "high"], state="readonly", width=12)\
         .grid(row=1, column=3, sticky="w", pady=(8, 0))
 
-    # ------- Time Zone (City only) -------
-    tz_group = ttk.LabelFrame(wrapper, text="Time Zone (select city)", padding=12)
-    tz_group.pack(fill="both", pady=(16, 0))
-
-    # Search + list
-    top_bar = ttk.Frame(tz_group); top_bar.pack(fill="x")
-    ttk.Label(top_bar, text="Search:").pack(side="left")
-    search_var = tk.StringVar(); ttk.Entry(top_bar, textvariable=search_var, width=28).pack(side="left", padx=(6, 0))
-
-    city_list = tk.Listbox(tz_group, height=12, exportselection=False)
-    city_list.pack(side="left", fill="both", expand=True, pady=(8,0))
-    scroll = ttk.Scrollbar(tz_group, orient="vertical", command=city_list.yview)
-    scroll.pack(side="left", fill="y", pady=(8,0))
-    city_list.configure(yscrollcommand=scroll.set)
-
-    preview_var = tk.StringVar(value="")
-    ttk.Label(tz_group, textvariable=preview_var, font=("Consolas", 10)).pack(anchor="w", pady=(8,0))
-
-    # Populate list
-    def _reload_list():
-        q = (search_var.get() or "").strip().lower()
-        city_list.delete(0, "end")
-        for tz, label in CITIES:
-            display = _format_city_display(tz, label)
-            if not q or q in label.lower() or q in tz.lower():
-                city_list.insert("end", display)
-
-    _reload_list()
-
-    def _select_from_current():
-        cur = (current.timezone or "").strip()
-        if not cur:
-            return
-        for i in range(city_list.size()):
-            txt = city_list.get(i)
-            if f"({cur})" in txt:
-                city_list.selection_set(i); city_list.see(i)
-                # preview with IANA or with fallback offset
-                try:
-                    now_txt = datetime.now(ZoneInfo(cur)).strftime("%Y-%m-%d  %H:%M:%S") if ZoneInfo else None
-                except Exception:
-                    now_txt = None
-                if not now_txt:
-                    off = _city_to_current_offset_str(cur)
-                    now_txt = datetime.now(_tzinfo_from_offset_str(off)).strftime("%Y-%m-%d  %H:%M:%S")
-                preview_var.set(f"Preview: {txt.split(' — ')[0]} → {now_txt}")
-                return
+    # ------- Time Zone (City only), built on first visit of its tab -------
+    # (the display strings are cached at import; deferring skips creating the
+    # search/list/preview widgets and filling ~40 Listbox rows on hydration-only edits)
+    tz_panel: Dict[str, object] = {}
+
+    def _build_tz():
+        tz_group = ttk.LabelFrame(tz_tab, text="Time Zone (select city)", padding=12)
+        tz_group.pack(fill="both", expand=True, padx=16, pady=16)
+
+        # Search + list
+        top_bar = ttk.Frame(tz_group); top_bar.pack(fill="x")
+        ttk.Label(top_bar, text="Search:").pack(side="left")
+        search_var = tk.StringVar(); ttk.Entry(top_bar, textvariable=search_var, width=28).pack(side="left", padx=(6, 0))
+
+        city_list = tk.Listbox(tz_group, height=12, exportselection=False)
+        city_list.pack(side="left", fill="both", expand=True, pady=(8,0))
+        scroll = ttk.Scrollbar(tz_group, orient="vertical", command=city_list.yview)
+        scroll.pack(side="left", fill="y", pady=(8,0))
+        city_list.configure(yscrollcommand=scroll.set)
+
+        preview_var = tk.StringVar(value="")
+        ttk.Label(tz_group, textvariable=preview_var, font=("Consolas", 10)).pack(anchor="w", pady=(8,0))
+
+        # Populate list; `visible_tzs[i]` is the tz shown at listbox row i
+        visible_tzs: List[str] = []
+        tz_to_index: Dict[str, int] = {}
+
+        def _reload_list():
+            q = (search_var.get() or "").strip().lower()
+            matches = [(tz, display) for tz, _label, label_l, tz_l, display in _city_display_items()
+                       if not q or q in label_l or q in tz_l]
+            visible_tzs[:] = [tz for tz, _ in matches]
+            tz_to_index.clear(); tz_to_index.update((tz, i) for i, tz in enumerate(visible_tzs))
+            city_list.delete(0, "end")
+            city_list.insert("end", *(display for _, display in matches))   # one Tcl call for the whole list
 
-    _select_from_current()
-
-    def _on_search_change(*_):
         _reload_list()
 
-    search_var.trace_add("write", _on_search_change)
-
-    def _on_select(_evt=None):
-        sel = city_list.curselection()
-        if not sel:
-            preview_var.set(""); return
-        text = city_list.get(sel[0])
-        tz = text.split("(")[-1].split(")")[0]
-        # Preview: try IANA, else use offset
-        now_txt = None
-        if ZoneInfo is not None:
-            try:
-                now_txt = datetime.now(ZoneInfo(tz)).strftime("%Y-%m-%d  %H:%M:%S")
-            except Exception:
-                now_txt = None
-        if not now_txt:
-            off = _city_to_current_offset_str(tz)
-            now_txt = datetime.now(_tzinfo_from_offset_str(off)).strftime("%Y-%m-%d  %H:%M:%S")
-        preview_var.set(f"Preview: {text.split(' — ')[0]} → {now_txt}")
-
-    city_list.bind("<<ListboxSelect>>", _on_select)
+        def _select_from_current():
+            cur = (current.timezone or "").strip()
+            if not cur:
+                return
+            i = tz_to_index.get(cur)
+            if i is None:
+                return
+            txt = city_list.get(i)
+            city_list.selection_set(i); city_list.see(i)
+            # preview with IANA or with fallback offset
+            zi = _zi(cur)
+            now_txt = datetime.now(zi).strftime("%Y-%m-%d  %H:%M:%S") if zi is not None else None
+            if not now_txt:
+                off = _city_to_current_offset_str(cur)
+                now_txt = datetime.now(_tzinfo_from_offset_str(off)).strftime("%Y-%m-%d  %H:%M:%S")
+            preview_var.set(f"Preview: {txt.split(' — ')[0]} → {now_txt}")
+
+        _select_from_current()
+
+        # typing bursts coalesce into one reload, 120 ms after the last keystroke
+        search_var.trace_add("write", debounced(city_list, 120, _reload_list))
+
+        def _on_select(_evt=None):
+            sel = city_list.curselection()
+            if not sel:
+                preview_var.set(""); return
+            text = city_list.get(sel[0])
+            tz = visible_tzs[sel[0]]
+            # Preview: try IANA, else use offset
+            zi = _zi(tz)
+            now_txt = datetime.now(zi).strftime("%Y-%m-%d  %H:%M:%S") if zi is not None else None
+            if not now_txt:
+                off = _city_to_current_offset_str(tz)
+                now_txt = datetime.now(_tzinfo_from_offset_str(off)).strftime("%Y-%m-%d  %H:%M:%S")
+            preview_var.set(f"Preview: {text.split(' — ')[0]} → {now_txt}")
+
+        city_list.bind("<<ListboxSelect>>", _on_select)
+
+        tz_panel.update(city_list=city_list, visible_tzs=visible_tzs)
+
+    def _on_tab_changed(_evt=None):
+        if not tz_panel and notebook.select() == str(tz_tab):
+            _build_tz()
+
+    notebook.bind("<<NotebookTabChanged>>", _on_tab_changed)
 
     # ------- Buttons -------
-    btns = ttk.Frame(wrapper); btns.pack(fill="x", pady=(16, 0))
     apply_btn = ttk.Button(btns, text="Apply & Save")
     close_btn = ttk.Button(btns, text="Close", command=win.destroy)
     close_btn.pack(side="right"); apply_btn.pack(side="right", padx=(0, 8))
 
-    # Helpers
-    def _parse_float(s: str) -> Optional[float]:
-        try: return float((s or "").replace(",", "."))
-        except Exception: return None
-
     def on_apply():
         # Validate hydration fields
         sex = (sex_var.get() or "").strip()
-        w = _parse_float(weight_var.get())
-        t = _parse_float(temp_var.get())
+        w = parse_float(weight_var.get())
+        t = parse_float(temp_var.get())
         act = (activity_var.get() or "").strip()
 
         if sex not in ("male", "female"):
@@ -336,26 +391,26 @@ def open_settings_window(root: tk.Tk) -> dict:
         if act not in ("low", "moderate", "high"):
             messagebox.showerror("Invalid", "Choose an activity level.", parent=win); return
 
-        # Selected city
-        sel = city_list.curselection()
-        if not sel:
+        # Selected city (tab never opened → keep the saved time zone)
+        if tz_panel:
+            sel = tz_panel["city_list"].curselection()
+            tz = tz_panel["visible_tzs"][sel[0]] if sel else None
+        else:
+            tz = None
+        if tz is None and (tz_panel or not current.timezone):
+            notebook.select(tz_tab)
             messagebox.showerror("Time Zone", "Select a city (e.g., Athens, Greece).", parent=win); return
-        text = city_list.get(sel[0])
-        tz = text.split("(")[-1].split(")")[0]
-
-        # If we can instantiate ZoneInfo(tz) NOW → save IANA, else save current offset
-        final_tz = None
-        if ZoneInfo is not None:
-            try:
-                ZoneInfo(tz)  # probe
-                final_tz = tz
-            except Exception:
-                final_tz = None
-        if final_tz is None:
-            final_tz = _city_to_current_offset_str(tz)
+
+        if tz is None:
+            final_tz = current.timezone
+        else:
+            # If ZoneInfo(tz) works here → save IANA, else save current offset
+            final_tz = tz if _zi(tz) is not None else None
+            if final_tz is None:
+                final_tz = _city_to_current_offset_str(tz)
 
         # Hydration: update profile + reset (consistent with Home)
-        climate = "cool" if (t or 0) <= 10 else ("hot" if (t or 0) >= 25 else "temperate")
+        climate = hc.climate_from_temperature(t)
         hc.set_profile(sex=sex, weight_kg=w, climate=climate, activity=act)
         hc.reset_today()
 
@@ -367,4 +422,4 @@ def open_settings_window(root: tk.Tk) -> dict:
 
     apply_btn.configure(command=on_apply)
 
-    return {"window": win, "notebook": notebook, "settings": settings_tab}
+    return {"window": win, "notebook": notebook, "settings": settings_tab, "timezone": tz_tab}
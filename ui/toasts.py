@@ -11,38 +11,58 @@ Features:
 - Appears bottom-right of the parent window
 - Auto-dismisses after the specified duration
 - No window decorations (borderless, topmost)
+- One hidden popup is reused for every toast (shown/withdrawn, never destroyed)
 """
 
 import tkinter as tk
 
 
-def show_toast(root: tk.Tk, message: str, duration_ms: int = 2000) -> None:
-    """
-    Display a small toast popup at the bottom-right corner of the main window.
+# The reused popup: its master window, the Toplevel, its Label and the
+# pending hide job (cancelled when a new toast replaces the current one)
+_toast_singleton = {"root": None, "win": None, "label": None, "after": None}
 
-    Args:
-        root (tk.Tk): The main Tkinter window.
-        message (str): The text message to display.
-        duration_ms (int): How long the toast stays visible (in milliseconds).
-    """
-    # Ensure geometry is up-to-date
-    root.update_idletasks()
+# Last known client-area geometry of the master window, kept current by a
+# <Configure> binding so showing a toast needs no geometry round-trips
+_root_geom = {"x": None, "y": None, "w": None, "h": None}
 
-    # Create popup window
-    toast = tk.Toplevel(root)
-    toast.overrideredirect(True)  # No title bar or borders
-    toast.attributes("-topmost", True)
 
-    # Position near bottom-right of the root window
-    width, height = 260, 80
-    x = root.winfo_rootx() + root.winfo_width() - width - 20
-    y = root.winfo_rooty() + root.winfo_height() - height - 40
-    toast.geometry(f"{width}x{height}+{x}+{y}")
+def _track_root_geometry(root: tk.Tk) -> None:
+    def _on_configure(e):
+        if e.widget is root:
+            _root_geom.update(x=root.winfo_rootx(), y=root.winfo_rooty(), w=e.width, h=e.height)
+    root.bind("<Configure>", _on_configure, add="+")
+
+
+def _retire_toast() -> None:
+    """Cancel the pending hide job and destroy the popup before it is replaced."""
+    win, job = _toast_singleton["win"], _toast_singleton["after"]
+    _toast_singleton.update(win=None, label=None, after=None)
+    if win is None:
+        return
+    try:
+        if job is not None:
+            win.after_cancel(job)
+        if win.winfo_exists():
+            win.destroy()
+    except tk.TclError:
+        pass  # master already torn down
+
+
+def _toast_window(root: tk.Tk):
+    """Return the (Toplevel, Label) pair for `root`, creating it once."""
+    win = _toast_singleton["win"]
+    if win is not None and _toast_singleton["root"] is root and win.winfo_exists():
+        return win, _toast_singleton["label"]
+    _retire_toast()
+
+    win = tk.Toplevel(root)
+    win.withdraw()
+    win.overrideredirect(True)  # No title bar or borders
+    win.attributes("-topmost", True)
 
     # Style
     label = tk.Label(
-        toast,
-        text=message,
+        win,
         bg="#333333",
         fg="#FFFFFF",
         wraplength=240,
@@ -52,5 +72,46 @@ def show_toast(root: tk.Tk, message: str, duration_ms: int = 2000) -> None:
     )
     label.pack(fill="both", expand=True)
 
-    # Auto-destroy after duration
-    toast.after(duration_ms, toast.destroy)
+    if _toast_singleton["root"] is not root:
+        _root_geom.update(x=None, y=None, w=None, h=None)
+        _track_root_geometry(root)
+    _toast_singleton.update(root=root, win=win, label=label, after=None)
+    return win, label
+
+
+def _hide_toast() -> None:
+    _toast_singleton["after"] = None
+    win = _toast_singleton["win"]
+    if win is not None and win.winfo_exists():
+        win.withdraw()
+
+
+def show_toast(root: tk.Tk, message: str, duration_ms: int = 2000) -> None:
+    """
+    Display a small toast popup at the bottom-right corner of the main window.
+
+    Args:
+        root (tk.Tk): The main Tkinter window.
+        message (str): The text message to display.
+        duration_ms (int): How long the toast stays visible (in milliseconds).
+    """
+    win, label = _toast_window(root)
+    label.configure(text=message)
+
+    # Position near bottom-right of the root window (cached geometry; query
+    # Tk only until the first <Configure> has been seen)
+    g = _root_geom
+    if g["w"] is None:
+        root.update_idletasks()
+        g.update(x=root.winfo_rootx(), y=root.winfo_rooty(), w=root.winfo_width(), h=root.winfo_height())
+    width, height = 260, 80
+    x = g["x"] + g["w"] - width - 20
+    y = g["y"] + g["h"] - height - 40
+    win.geometry(f"{width}x{height}+{x}+{y}")
+    win.deiconify()
+    win.lift()
+
+    # Auto-hide after duration (a newer toast restarts the timer)
+    if _toast_singleton["after"] is not None:
+        win.after_cancel(_toast_singleton["after"])
+    _toast_singleton["after"] = win.after(duration_ms, _hide_toast)
@@ -17,19 +17,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Tuple
 
-from core.settings import AppSettings, save_settings
+from core.settings import AppSettings, parse_float, save_settings
 from features.hydration import controller as hc
 
 
-def _climate_from_temperature(temp_c: float) -> str:
-    """Convert ambient temperature (°C) into a climate category."""
-    if temp_c <= 10:
-        return "cool"
-    if temp_c >= 25:
-        return "hot"
-    return "temperate"
-
-
 def run_first_time_wizard(root: tk.Tk, existing: Optional[AppSettings] = None) -> Tuple[Optional[AppSettings], bool]:
     """
     Launch the initial setup wizard.
@@ -95,12 +86,6 @@ def run_first_time_wizard(root: tk.Tk, existing: Optional[AppSettings] = None) -
     ok_btn = ttk.Button(btns, text="Continue")
     cancel_btn = ttk.Button(btns, text="Exit")
 
-    def _parse_float(s: str) -> Optional[float]:
-        try:
-            return float((s or "").replace(",", "."))
-        except Exception:
-            return None
-
     def on_cancel() -> None:
         cancelled["v"] = True
         try:
@@ -112,8 +97,8 @@ def run_first_time_wizard(root: tk.Tk, existing: Optional[AppSettings] = None) -
     def on_continue() -> None:
         nonlocal s
         sex = sex_var.get().strip()
-        w = _parse_float(weight_var.get().strip())
-        t = _parse_float(temp_var.get().strip())
+        w = parse_float(weight_var.get().strip())
+        t = parse_float(temp_var.get().strip())
         activity = activity_var.get().strip()
 
         # Validation
@@ -126,7 +111,7 @@ def run_first_time_wizard(root: tk.Tk, existing: Optional[AppSettings] = None) -
         if activity not in ("low", "moderate", "high"):
             messagebox.showerror("Invalid", "Please choose activity level.", parent=dlg); return
 
-        climate = _climate_from_temperature(t)
+        climate = hc.climate_from_temperature(t)
         hc.set_profile(sex=sex, weight_kg=w, climate=climate, activity=activity)
         hc.reset_today()
 
@@ -1,8 +1,23 @@
 import os, sys
-print("Python:", sys.executable)
-print("CWD   :", os.getcwd())
-try:
-    import pytest; print("pytest:", pytest.__version__)
-    import core; print("core OK:", core.__file__)
-except Exception as e:
-    print("ERROR:", e)
+from importlib import metadata, util
+
+
+def main() -> None:
+    print("Python:", sys.executable)
+    print("CWD   :", os.getcwd())
+    # pytest: locate + read version from metadata, without importing it
+    try:
+        if util.find_spec("pytest") is None:
+            print("pytest: not installed")
+        else:
+            print("pytest:", metadata.version("pytest"))
+    except Exception as e:
+        print("ERROR (pytest):", e)
+    try:
+        import core; print("core OK:", core.__file__)
+    except Exception as e:
+        print("ERROR (core):", e)
+
+
+if __name__ == "__main__":
+    main()